@@ -47,7 +47,7 @@ python src\system\boot_animation.py resources
 
 :: Copy modified files
 echo [*] Copying modified files...
-xcopy /y "build\boot_animation.gif" "work\System\Library\CoreServices\"
+xcopy /y "build\boot_animation.mp4" "work\System\Library\CoreServices\"
 xcopy /y "build\BootAnimation.plist" "work\System\Library\CoreServices\"
 xcopy /y "src\system\modifications.plist" "work\System\Library\LaunchDaemons\"
 
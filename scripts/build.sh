@@ -249,8 +249,8 @@ apply_system_modifications() {
         log_info "Applying custom resources..."
         
         # Copy boot animation
-        if [ -f "$RESOURCES_DIR/boot_animation/boot_animation.gif" ]; then
-            cp "$RESOURCES_DIR/boot_animation/boot_animation.gif" "$WORK_DIR/System/Library/CoreServices/"
+        if [ -f "$RESOURCES_DIR/boot_animation/boot_animation.mp4" ]; then
+            cp "$RESOURCES_DIR/boot_animation/boot_animation.mp4" "$WORK_DIR/System/Library/CoreServices/"
         fi
         
         # Copy other resources as needed
@@ -87,7 +87,7 @@ apply_system_modifications() {
     
     # Create boot animation
     python3 "$SRC_DIR/system/boot_animation.py" "$RESOURCES_DIR"
-    cp "$OUTPUT_DIR/boot_animation.gif" "$WORK_DIR/System/Library/CoreServices/"
+    cp "$OUTPUT_DIR/boot_animation.mp4" "$WORK_DIR/System/Library/CoreServices/"
     cp "$OUTPUT_DIR/BootAnimation.plist" "$WORK_DIR/System/Library/CoreServices/"
     
     # Add LilithOS branding
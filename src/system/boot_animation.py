@@ -6,17 +6,29 @@ Creates custom boot animations for iPhone 13 Pro Max with 120Hz ProMotion suppor
 
 import os
 import sys
-import math
 import argparse
+import functools
+import itertools
 import logging
-import random  # Use dedicated RNG for reproducible particle effects
+import multiprocessing
+import queue
+import shutil
+import subprocess
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Tuple, List, Optional
+from typing import Dict, Iterator, Tuple, List, Optional
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
-import imageio
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 
+try:
+    import numba
+except ImportError:  # Numba is optional; fall back to the NumPy splat
+    numba = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO,
                    format='%(asctime)s - %(levelname)s - %(message)s')
@@ -24,12 +36,90 @@ logger = logging.getLogger(__name__)
 
 console = Console()
 
+@functools.lru_cache(maxsize=8)
+def _load_font(size: int) -> ImageFont.ImageFont:
+    """Load the UI font at ``size`` once, falling back to PIL's default."""
+    # Try to use system font, fallback to default
+    try:
+        return ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", size)
+    except OSError:
+        try:
+            return ImageFont.truetype("/System/Library/Fonts/Arial.ttf", size)
+        except OSError:
+            return ImageFont.load_default()
+
+def _blend_into(dst, src, x, y, alpha=None):
+    """Alpha-blend RGBA ``src`` into ``dst`` at ``(x, y)``, clipped to ``dst``.
+
+    Matches ``Image.paste(src, (x, y), src)``: every channel, alpha included,
+    is mixed by the source alpha. ``alpha`` overrides the source alpha with a
+    uniform value, as ``putalpha`` would.
+    """
+    height, width = dst.shape[:2]
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + src.shape[1], width), min(y + src.shape[0], height)
+    if x0 >= x1 or y0 >= y1:
+        return
+
+    region = dst[y0:y1, x0:x1]
+    src = src[y0 - y:y1 - y, x0 - x:x1 - x].astype(np.uint16)
+    if alpha is None:
+        mask = src[..., 3:4]
+    else:
+        src[..., 3] = alpha
+        mask = np.uint16(alpha)
+    region[...] = (src * mask + region * (255 - mask) + 127) // 255
+
+def _splat_particles_numpy(canvas, xs, ys, colors, radius):
+    """Stamp a square per particle into ``canvas`` using fancy indexing."""
+    height, width = canvas.shape[:2]
+    dy, dx = np.mgrid[-radius:radius + 1, -radius:radius + 1]
+    rows = ys[:, None, None] + dy
+    cols = xs[:, None, None] + dx
+    inside = (rows >= 0) & (rows < height) & (cols >= 0) & (cols < width)
+    stamps = np.broadcast_to(colors[:, None, None, :], rows.shape + (4,))
+
+    canvas[rows[inside], cols[inside]] = stamps[inside]
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True, fastmath=True)
+    def _splat_particles(canvas, xs, ys, colors, radius):
+        """Stamp a square per particle into ``canvas``, one particle per thread."""
+        height, width = canvas.shape[0], canvas.shape[1]
+        for p in numba.prange(xs.shape[0]):
+            for dy in range(-radius, radius + 1):
+                row = ys[p] + dy
+                if row < 0 or row >= height:
+                    continue
+                for dx in range(-radius, radius + 1):
+                    col = xs[p] + dx
+                    if col < 0 or col >= width:
+                        continue
+                    for channel in range(4):
+                        canvas[row, col, channel] = colors[p, channel]
+else:
+    _splat_particles = _splat_particles_numpy
+
 class LilithOSBootAnimation:
     """Generates custom boot animations for LilithOS."""
     
-    def __init__(self, output_dir: str = "resources/boot_animation"):
+    # Container suffix and FFmpeg output arguments for each supported format
+    OUTPUT_FORMATS = {
+        "mp4": (".mp4", ["-c:v", "libx264", "-pix_fmt", "yuv420p"]),
+        "apng": (".png", ["-c:v", "apng", "-plays", "0", "-f", "apng"]),
+        # palettegen only emits the palette at EOF, so FFmpeg buffers every
+        # frame for paletteuse; GIF output needs memory for the whole clip
+        "gif": (".gif", ["-vf", "split[a][b];[a]palettegen[p];[b][p]paletteuse", "-loop", "0"]),
+    }
+    
+    def __init__(self, output_dir: str = "resources/boot_animation", workers: Optional[int] = None,
+                 output_format: str = "mp4"):
+        if output_format not in self.OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+        
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.output_format = output_format
         
         # iPhone 13 Pro Max specifications
         self.width = 2778
@@ -41,6 +131,12 @@ class LilithOSBootAnimation:
         self.total_frames = int(self.fps * self.duration)
         self.frame_duration = 1.0 / self.fps
         
+        # Frame rendering processes (defaults to one per CPU)
+        self.workers = workers
+        
+        # Frames buffered between rendering and the encoder thread
+        self.queue_depth = 4
+        
         # Colors (LilithOS theme)
         self.colors = {
             "background": (0, 0, 0),  # Black
@@ -56,6 +152,18 @@ class LilithOSBootAnimation:
             "main_animation": 0.5,  # 50% of duration
             "fade_out": 0.2      # 20% of duration
         }
+        
+        # Particle system
+        self.num_particles = 50
+        self.particle_seed = 0
+        
+        # Particle state and lookup tables, (re)built on first use
+        self._particle_key: Optional[Tuple[int, ...]] = None
+        self._layers: Dict[int, Tuple[Image.Image, Image.Image]] = {}
+        self._phase_key: Optional[Tuple[float, ...]] = None
+        self._ladder_source: Optional[Image.Image] = None
+        self._logo_ladder: Dict[Tuple[float, bool], np.ndarray] = {}
+        self._layer_arrays: Dict[int, Tuple[Image.Image, np.ndarray]] = {}
     
     def create_logo(self, size: Tuple[int, int]) -> Image.Image:
         """Create the LilithOS logo."""
@@ -103,14 +211,7 @@ class LilithOSBootAnimation:
     
     def create_text(self, text: str, size: int = 72) -> Image.Image:
         """Create text with custom styling."""
-        # Try to use system font, fallback to default
-        try:
-            font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", size)
-        except:
-            try:
-                font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", size)
-            except:
-                font = ImageFont.load_default()
+        font = _load_font(size)
         
         # Create text image
         text_img = Image.new('RGBA', (self.width, size * 2), (0, 0, 0, 0))
@@ -135,167 +236,381 @@ class LilithOSBootAnimation:
         
         return text_img
     
-    def create_particle_system(
-        self,
-        frame: int,
-        total_frames: int,
-        num_particles: int = 50,
-        seed: Optional[int] = None,
-    ) -> Image.Image:
-        """Create animated particle system.
+    def static_layers(self) -> Tuple[Image.Image, Image.Image]:
+        """Return the logo (with its blurred glow) and text, rendered once.
 
-        Using ``random.Random`` with an optional seed keeps particle motion
-        deterministic per frame while allowing callers to tweak density.
+        Both are identical for every frame, so the Gaussian glow and font
+        rasterization run once per resolution and are shared with workers.
+        """
+        if self.width not in self._layers:
+            self._layers[self.width] = (
+                self.create_logo((400, 400)),
+                self.create_text("LilithOS", 72)
+            )
+        return self._layers[self.width]
+    
+    def _prepare_phases(self, total_frames: int) -> None:
+        """Tabulate every frame's logo/text alpha and logo scale.
+
+        The phase of each frame (fade in, main animation, fade out) is
+        resolved once with vectorized masks instead of branching per frame.
+        An alpha of -1 leaves the layers' own alpha untouched.
+        """
+        key = (total_frames, *self.phases.values())
+        if key == self._phase_key:
+            return
+        
+        fade_in = self.phases["fade_in"]
+        main = self.phases["main_animation"]
+        fade_out = self.phases["fade_out"]
+        
+        progress = np.arange(total_frames) / total_frames
+        in_fade_in = progress < fade_in
+        in_main = ~in_fade_in & (progress < fade_in + main)
+        in_fade_out = ~(in_fade_in | in_main)
+        
+        phase_progress = np.select(
+            [in_fade_in, in_main],
+            [progress / fade_in, (progress - fade_in) / main],
+            (progress - fade_in - main) / fade_out
+        )
+        self._frame_alpha = np.select(
+            [in_fade_in, in_fade_out],
+            [255 * phase_progress, 255 * (1 - phase_progress)],
+            -1
+        ).astype(np.int16)
+        self._frame_scale = np.select(
+            [in_fade_in, in_main],
+            [0.5 + 0.5 * phase_progress, 1.0 + 0.1 * np.sin(phase_progress * np.pi * 4)],
+            1.0
+        )
+        self._phase_key = key
+    
+    def _layer_array(self, layer: Image.Image) -> np.ndarray:
+        """Return ``layer`` as a read-only RGBA ndarray, converted once."""
+        cached = self._layer_arrays.get(id(layer))
+        if cached is None or cached[0] is not layer:
+            cached = self._layer_arrays[id(layer)] = (layer, np.asarray(layer))
+        return cached[1]
+    
+    def _scaled_logo(self, logo: Image.Image, scale: float, opaque: bool = False) -> np.ndarray:
+        """Return ``logo`` resized by ``scale`` as an RGBA ndarray.
+
+        Resizes are memoized on a 0.01-step ladder.
+
+        The fade-in and pulse phases only ever use ~100 distinct scales, so
+        each LANCZOS resize is done once. ``opaque`` resizes with the alpha
+        channel forced to 255, which matches resizing after a uniform
+        ``putalpha`` (Pillow resamples RGBA premultiplied).
+        """
+        if self._ladder_source is not logo:
+            self._ladder_source = logo
+            self._logo_ladder = {}
+        
+        key = (round(scale, 2), opaque)
+        resized = self._logo_ladder.get(key)
+        if resized is None:
+            source = logo
+            if opaque:
+                source = logo.copy()
+                source.putalpha(255)
+            new_size = (int(logo.width * key[0]), int(logo.height * key[0]))
+            resized = np.asarray(source.resize(new_size, Image.Resampling.LANCZOS))
+            self._logo_ladder[key] = resized
+        return resized
+    
+    def _prepare_particles(self) -> None:
+        """Initialise particle state as a structure of arrays.
+
+        Each particle gets a base position and a sine phase, stored as
+        contiguous ``float32`` arrays alongside preallocated per-frame work
+        buffers, and the per-frame progress values are tabulated once. State
+        is rebuilt if the resolution, frame count or particle count changes.
+        """
+        key = (self.width, self.height, self.total_frames, self.num_particles, self.particle_seed)
+        if key == self._particle_key:
+            return
+        
+        count = self.num_particles
+        rng = np.random.default_rng(self.particle_seed)
+        self._px0 = rng.integers(0, self.width, count).astype(np.float32)
+        self._py0 = rng.integers(0, self.height, count).astype(np.float32)
+        self._pphase = (rng.random(count) * 0.1).astype(np.float32)
+        
+        self._pwave = np.empty(count, dtype=np.float32)
+        self._pxs = np.empty(count, dtype=np.float32)
+        self._pys = np.empty(count, dtype=np.float32)
+        self._pxi = np.empty(count, dtype=np.intp)
+        self._pyi = np.empty(count, dtype=np.intp)
+        self._palpha = np.empty(count, dtype=np.uint16)
+        self._pcolors = np.empty((count, 4), dtype=np.uint8)
+        
+        self._progress = np.arange(self.total_frames) / self.total_frames
+        self._particle_key = key
+    
+    def step_particles(self, frame: int, canvas: np.ndarray) -> None:
+        """Advance the particle system to ``frame`` and draw it into ``canvas``.
+
+        Positions are a pure function of the frame index, computed with
+        in-place vectorized ops over the particle arrays, so frames stay
+        deterministic even when rendered out of order by worker processes.
+        Particle colours are blended against the background up front, so
+        ``_splat_particles`` (Numba-compiled when available) writes final
+        pixels straight into a frame that holds only the background. Density
+        is set by ``num_particles``.
 
         Args:
             frame: Current frame index.
-            total_frames: Total number of frames in the animation.
-            num_particles: How many particles to render.
-            seed: Optional seed for reproducible randomness.
+            canvas: RGBA frame buffer filled with the background colour.
         """
-        rng = random.Random(seed if seed is not None else frame)
-        particles = Image.new("RGBA", (self.width, self.height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(particles)
+        self._prepare_particles()
 
         particle_size = 3
         max_velocity = 2
-        progress = frame / total_frames
-
-        for _ in range(num_particles):
-            # Pseudo-random starting position
-            x = rng.randint(0, self.width - 1)
-            y = rng.randint(0, self.height - 1)
-
-            # Animate particles with a sine wave for subtle movement
-            wave = math.sin(progress * math.pi * 2 + rng.random() * 0.1)
-            x = (x + wave * max_velocity * 10) % self.width
-            y = (y + progress * max_velocity * 5) % self.height
-
-            opacity = int(255 * (1 - abs(wave)))
-            color = (*self.colors["primary"][:3], opacity)
-            draw.ellipse(
-                [x - particle_size, y - particle_size, x + particle_size, y + particle_size],
-                fill=color,
-            )
+        progress = self._progress[frame]
+
+        # Animate particles with a sine wave for subtle movement
+        wave = self._pwave
+        np.add(self._pphase, progress * np.pi * 2, out=wave)
+        np.sin(wave, out=wave)
 
-        return particles
+        np.multiply(wave, max_velocity * 10, out=self._pxs)
+        self._pxs += self._px0
+        np.mod(self._pxs, self.width, out=self._pxs)
+        np.add(self._py0, progress * max_velocity * 5, out=self._pys)
+        np.mod(self._pys, self.height, out=self._pys)
+        np.copyto(self._pxi, self._pxs, casting="unsafe")
+        np.copyto(self._pyi, self._pys, casting="unsafe")
+
+        opacity = self._palpha
+        np.copyto(opacity, 255 * (1 - np.abs(wave)), casting="unsafe")
+
+        # Blend each particle's colour over the opaque background
+        color = np.array(self.colors["primary"][:3], dtype=np.uint16)
+        background = np.array((*self.colors["background"], 255), dtype=np.uint16)
+        mask = opacity[:, None]
+        blended = np.empty((self.num_particles, 4), dtype=np.uint16)
+        blended[:, :3] = color
+        blended[:, 3:] = mask
+        np.copyto(
+            self._pcolors,
+            (blended * mask + background * (255 - mask) + 127) // 255,
+            casting="unsafe"
+        )
+
+        _splat_particles(canvas, self._pxi, self._pyi, self._pcolors, particle_size)
     
-    def create_frame(self, frame: int, total_frames: int) -> Image.Image:
-        """Create a single animation frame."""
-        # Create base image
-        frame_img = Image.new('RGBA', (self.width, self.height), self.colors["background"])
-        
-        # Calculate animation progress
-        progress = frame / total_frames
-        
-        # Determine animation phase
-        if progress < self.phases["fade_in"]:
-            phase = "fade_in"
-            phase_progress = progress / self.phases["fade_in"]
-        elif progress < self.phases["fade_in"] + self.phases["main_animation"]:
-            phase = "main_animation"
-            phase_progress = (progress - self.phases["fade_in"]) / self.phases["main_animation"]
-        else:
-            phase = "fade_out"
-            phase_progress = (progress - self.phases["fade_in"] - self.phases["main_animation"]) / self.phases["fade_out"]
-        
-        # Create logo
+    def create_frame(
+        self,
+        frame: int,
+        total_frames: int,
+        logo: Optional[Image.Image] = None,
+        text: Optional[Image.Image] = None,
+    ) -> np.ndarray:
+        """Create a single animation frame as an ``(H, W, 4)`` uint8 array.
+
+        Frames are composited directly on NumPy buffers; the logo and text are
+        only rasterized by PIL once (see ``static_layers``/``_scaled_logo``).
+
+        Args:
+            frame: Current frame index.
+            total_frames: Total number of frames in the animation.
+            logo: Pre-rendered 400x400 logo; defaults to ``static_layers()``.
+            text: Pre-rendered "LilithOS" text; defaults to ``static_layers()``.
+        """
+        # Create base image (filled a whole RGBA pixel at a time)
+        frame_img = np.empty((self.height, self.width, 4), dtype=np.uint8)
+        background = np.array((*self.colors["background"], 255), dtype=np.uint8)
+        frame_img.view(np.uint32).fill(background.view(np.uint32)[0])
+        
+        # Per-frame effects come from the precomputed phase table
+        self._prepare_phases(total_frames)
+        alpha = int(self._frame_alpha[frame])
+        scale = float(self._frame_scale[frame])
+        
+        # Logo and text are identical every frame; only transforms vary
         logo_size = (400, 400)
-        logo = self.create_logo(logo_size)
+        if logo is None or text is None:
+            default_logo, default_text = self.static_layers()
+            logo = default_logo if logo is None else logo
+            text = default_text if text is None else text
         
         # Position logo
         logo_x = (self.width - logo_size[0]) // 2
         logo_y = (self.height - logo_size[1]) // 2 - 100
         
-        # Apply phase-specific effects
-        if phase == "fade_in":
-            # Fade in effect
-            alpha = int(255 * phase_progress)
-            logo.putalpha(alpha)
-            
-            # Scale effect
-            scale = 0.5 + 0.5 * phase_progress
-            new_size = (int(logo_size[0] * scale), int(logo_size[1] * scale))
-            logo = logo.resize(new_size, Image.Resampling.LANCZOS)
-            
-        elif phase == "main_animation":
-            # Main animation phase
-            # Add pulsing effect
-            pulse = 1.0 + 0.1 * math.sin(phase_progress * math.pi * 4)
-            new_size = (int(logo_size[0] * pulse), int(logo_size[1] * pulse))
-            logo = logo.resize(new_size, Image.Resampling.LANCZOS)
-            
-        else:  # fade_out
-            # Fade out effect
-            alpha = int(255 * (1 - phase_progress))
-            logo.putalpha(alpha)
-        
-        # Add particle system
-        particles = self.create_particle_system(frame, total_frames, seed=frame)
-        
-        # Create text
-        text = self.create_text("LilithOS", 72)
-        text_y = logo_y + logo_size[1] + 50
+        # Scale (fade-in growth, main pulse); fades apply a uniform alpha
+        logo_array = self._scaled_logo(logo, scale, opaque=alpha >= 0)
+        text_array = self._layer_array(text)
+        layer_alpha = alpha if alpha >= 0 else None
         
-        # Apply text effects
-        if phase == "fade_in":
-            text_alpha = int(255 * phase_progress)
-            text.putalpha(text_alpha)
-        elif phase == "fade_out":
-            text_alpha = int(255 * (1 - phase_progress))
-            text.putalpha(text_alpha)
+        # Position text
+        text_y = logo_y + logo_size[1] + 50
         
         # Composite all elements
-        frame_img.paste(particles, (0, 0), particles)
-        frame_img.paste(logo, (logo_x, logo_y), logo)
-        frame_img.paste(text, (0, text_y), text)
+        self.step_particles(frame, frame_img)
+        _blend_into(frame_img, logo_array, logo_x, logo_y, layer_alpha)
+        _blend_into(frame_img, text_array, 0, text_y, layer_alpha)
         
         return frame_img
     
+    def _settings(self) -> Dict:
+        """Return the picklable settings worker processes rebuild from."""
+        return {
+            "output_dir": str(self.output_dir),
+            "width": self.width,
+            "height": self.height,
+            "fps": self.fps,
+            "duration": self.duration,
+            "total_frames": self.total_frames,
+            "frame_duration": self.frame_duration,
+            "num_particles": self.num_particles,
+            "particle_seed": self.particle_seed,
+            "colors": dict(self.colors),
+            "phases": dict(self.phases),
+        }
+    
+    def _iter_frames(self) -> Iterator[np.ndarray]:
+        """Yield every frame in order, rendering them across worker processes.
+
+        Frames are independent (particle state is seeded and positions are a
+        function of the frame index), so they are rendered in parallel and
+        the output is identical to a serial run. Only a small window of frames
+        is in flight at once, so memory stays bounded when the consumer is
+        slower than the workers.
+        """
+        workers = self.workers or os.cpu_count() or 1
+        logo, text = self.static_layers()
+        
+        if workers == 1:
+            for frame in range(self.total_frames):
+                yield self.create_frame(frame, self.total_frames, logo, text)
+            return
+        
+        # Spawn rather than fork: forking after the Numba threading layer
+        # has started in the parent can deadlock the children
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self._settings(), logo, text)
+        ) as executor:
+            frames = iter(range(self.total_frames))
+            pending = deque(executor.submit(_render_frame, frame)
+                            for frame in itertools.islice(frames, workers * 2))
+            while pending:
+                frame_img = pending.popleft().result()
+                for frame in itertools.islice(frames, 1):
+                    pending.append(executor.submit(_render_frame, frame))
+                yield frame_img
+    
+    def _flatten(self, frame_img: np.ndarray) -> bytes:
+        """Composite an RGBA frame over the background into raw RGB24 bytes.
+
+        Only pixels that are not fully opaque need blending; everything else
+        is copied through unchanged.
+        """
+        rgb = np.ascontiguousarray(frame_img[..., :3]).reshape(-1, 3)
+        partial = np.flatnonzero(frame_img[..., 3] != 255)
+        if partial.size:
+            rgba = frame_img.reshape(-1, 4)[partial].astype(np.uint16)
+            alpha = rgba[:, 3:4]
+            background = np.array(self.colors["background"], dtype=np.uint16)
+            rgb[partial] = (rgba[:, :3] * alpha + background * (255 - alpha)) // 255
+        return rgb.tobytes()
+    
+    def _open_encoder(self, output_path: Path) -> subprocess.Popen:
+        """Start FFmpeg encoding raw RGB24 frames from stdin into ``output_format``."""
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is None:
+            raise RuntimeError("ffmpeg not found in PATH; it is required to encode the animation")
+        
+        return subprocess.Popen(
+            [
+                ffmpeg, "-y", "-hide_banner", "-loglevel", "error",
+                "-f", "rawvideo", "-pix_fmt", "rgb24",
+                "-s", f"{self.width}x{self.height}", "-r", str(self.fps),
+                "-i", "-",
+                *self.OUTPUT_FORMATS[self.output_format][1],
+                str(output_path)
+            ],
+            stdin=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=1 << 20
+        )
+    
+    def _write_frames(self, encoder: subprocess.Popen, frames: queue.Queue,
+                      failure: List[BaseException]) -> None:
+        """Drain ``frames`` into the encoder until the ``None`` sentinel.
+
+        Runs on its own thread so flattening and pipe writes overlap with
+        rendering. Errors are recorded in ``failure`` for the producer, and the
+        queue keeps draining so the producer never blocks on a full queue.
+        """
+        try:
+            while True:
+                frame_img = frames.get()
+                if frame_img is None:
+                    break
+                encoder.stdin.write(self._flatten(frame_img))
+        except BaseException as e:
+            failure.append(e)
+            while frames.get() is not None:
+                pass
+        finally:
+            try:
+                encoder.stdin.close()
+            except BrokenPipeError:
+                pass
+    
     def generate_animation(self) -> str:
         """Generate the complete boot animation."""
         console.print("🎬 Generating LilithOS boot animation...")
         
-        frames = []
-        
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            console=console
-        ) as progress:
-            
-            task = progress.add_task("Creating frames...", total=self.total_frames)
-            
-            for frame in range(self.total_frames):
-                # Create frame
-                frame_img = self.create_frame(frame, self.total_frames)
-                frames.append(frame_img)
-                
-                progress.update(task, advance=1)
-        
-        # Save as GIF
-        output_path = self.output_dir / "boot_animation.gif"
-        
-        console.print("💾 Saving animation...")
-        
-        # Convert frames to RGB for GIF
-        rgb_frames = []
-        for frame in frames:
-            # Convert RGBA to RGB with black background
-            rgb_frame = Image.new('RGB', frame.size, self.colors["background"])
-            rgb_frame.paste(frame, (0, 0), frame)
-            rgb_frames.append(rgb_frame)
-        
-        # Save as GIF with optimized settings
-        imageio.mimsave(
-            output_path,
-            rgb_frames,
-            duration=self.frame_duration,
-            optimize=True,
-            quality=85
+        suffix = self.OUTPUT_FORMATS[self.output_format][0]
+        output_path = (self.output_dir / "boot_animation").with_suffix(suffix)
+        encoder = self._open_encoder(output_path)
+        
+        # Rendering feeds a bounded queue drained by the encoder thread
+        frames: queue.Queue = queue.Queue(maxsize=self.queue_depth)
+        failure: List[BaseException] = []
+        writer = threading.Thread(
+            target=self._write_frames,
+            args=(encoder, frames, failure),
+            name="ffmpeg-writer",
+            daemon=True
         )
+        writer.start()
+        
+        try:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                console=console
+            ) as progress:
+                
+                task = progress.add_task("Encoding frames...", total=self.total_frames)
+                
+                for frame_img in self._iter_frames():
+                    if failure:
+                        break
+                    frames.put(frame_img)
+                    progress.update(task, advance=1)
+        except BaseException:
+            encoder.kill()
+            raise
+        finally:
+            frames.put(None)
+            writer.join()
+            stderr = encoder.stderr.read()
+            encoder.wait()
+        
+        if failure and not isinstance(failure[0], BrokenPipeError):
+            raise failure[0]
+        if encoder.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed: {stderr.decode(errors='replace').strip()}")
         
         # Create plist file for iOS
         plist_path = self.output_dir / "BootAnimation.plist"
@@ -358,6 +673,25 @@ class LilithOSBootAnimation:
         with open(plist_path, 'w') as f:
             f.write(plist_content)
 
+# Per-process state for workers spawned by _iter_frames
+_worker: Dict = {}
+
+def _init_worker(settings: Dict, logo: Image.Image, text: Image.Image) -> None:
+    """Rebuild the generator inside a worker process around the shared layers."""
+    settings = dict(settings)
+    generator = LilithOSBootAnimation(settings.pop("output_dir"))
+    for name, value in settings.items():
+        setattr(generator, name, value)
+    
+    _worker["generator"] = generator
+    _worker["logo"] = logo
+    _worker["text"] = text
+
+def _render_frame(frame: int) -> np.ndarray:
+    """Render a single frame in a worker process."""
+    generator = _worker["generator"]
+    return generator.create_frame(frame, generator.total_frames, _worker["logo"], _worker["text"])
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate LilithOS boot animation for iPhone 13 Pro Max",
@@ -367,6 +701,7 @@ Examples:
   %(prog)s
   %(prog)s --output custom_animation
   %(prog)s --fps 60 --duration 5.0
+  %(prog)s --format gif
         """
     )
     
@@ -399,6 +734,18 @@ Examples:
         default=1284,
         help="Animation height (default: 1284 for iPhone 13 Pro Max)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of frame rendering processes (default: one per CPU)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=sorted(LilithOSBootAnimation.OUTPUT_FORMATS),
+        default="mp4",
+        help="Output format (default: mp4; gif is much slower, palette-limited, "
+             "and buffers every frame in FFmpeg, several GB at native resolution)"
+    )
     parser.add_argument(
         "--verbose", 
         action="store_true",
@@ -412,7 +759,8 @@ Examples:
     
     try:
         # Create boot animation generator
-        generator = LilithOSBootAnimation(args.output)
+        generator = LilithOSBootAnimation(args.output, workers=args.workers,
+                                          output_format=args.format)
         
         # Override default parameters if specified
         if args.fps != 120:
@@ -0,0 +1,55 @@
+"""Tests for the read-ahead SHA-256 pipeline in tools/download_ipsw.py."""
+
+import hashlib
+import io
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+from rich.progress import Progress
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools"))
+
+from download_ipsw import IPSWDownloader  # noqa: E402
+
+
+def make_downloader(tmp_path, data):
+    """Create a downloader whose IPSW is data, hashed in small chunks."""
+    downloader = IPSWDownloader("iPhone14,2", "17.2.1", str(tmp_path))
+    downloader.filepath.write_bytes(data)
+    downloader.HASH_CHUNK_SIZE = 64 * 1024
+    return downloader
+
+
+def reader_threads():
+    """Return the read-ahead threads that are still running."""
+    return [thread for thread in threading.enumerate() if thread.name == "sha256-read-ahead"]
+
+
+def test_sha256_matches_hashlib(tmp_path):
+    """Hashing a file spanning many chunks matches a plain hashlib digest."""
+    data = os.urandom(20 * 64 * 1024 + 12345)
+    downloader = make_downloader(tmp_path, data)
+
+    with Progress(console=Console(file=io.StringIO())) as progress:
+        task = progress.add_task("hash", total=len(data))
+        digest = downloader._sha256(progress, task)
+        assert progress.tasks[0].completed == len(data)
+    assert digest.hexdigest() == hashlib.sha256(data).hexdigest()
+    assert not reader_threads()
+
+
+def test_sha256_stops_reader_when_consumer_fails(tmp_path):
+    """An error on the hashing side shuts the read-ahead thread down."""
+    downloader = make_downloader(tmp_path, os.urandom(20 * 64 * 1024))
+
+    class FailingProgress:
+        def update(self, task, advance):
+            raise RuntimeError("interrupted")
+
+    with pytest.raises(RuntimeError, match="interrupted"):
+        downloader._sha256(FailingProgress(), None)
+    assert not reader_threads()
@@ -0,0 +1,194 @@
+"""Round-trip tests for the IPSW extractor and repacker in tools/sign_ipsw.py."""
+
+import os
+import struct
+import sys
+import time
+import tracemalloc
+import zipfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools"))
+
+from sign_ipsw import IPSWSigner  # noqa: E402
+
+MEMBERS = {
+    "BuildManifest.plist": (b"<plist>manifest</plist>\n" * 64, zipfile.ZIP_DEFLATED),
+    "Firmware/all_flash/LLB.bin": (os.urandom(300_000), zipfile.ZIP_STORED),
+    "Firmware/dfu/iBSS.bin": (os.urandom(300_000), zipfile.ZIP_DEFLATED),
+    "Firmware/zeros.dmg": (bytes(2_000_000), zipfile.ZIP_DEFLATED),
+    "Firmware/empty.bin": (b"", zipfile.ZIP_DEFLATED),
+    "Firmware/ünïcødé.txt": ("ünï".encode(), zipfile.ZIP_STORED),
+}
+DIRECTORIES = ["Firmware/", "Firmware/all_flash/", "Firmware/dfu/", "Firmware/unused/"]
+
+
+def make_ipsw(path, members=MEMBERS, directories=DIRECTORIES):
+    """Write a small archive laid out like an IPSW."""
+    with zipfile.ZipFile(path, "w") as archive:
+        for name in directories:
+            archive.writestr(zipfile.ZipInfo(name), b"")
+        for name, (data, method) in members.items():
+            archive.writestr(name, data, compress_type=method)
+    return path
+
+
+def patch_central_header(path, field_offset, fmt, value):
+    """Overwrite one field of the (only) central directory header in path."""
+    raw = bytearray(path.read_bytes())
+    struct.pack_into(fmt, raw, raw.index(b"PK\x01\x02") + field_offset, value)
+    path.write_bytes(bytes(raw))
+
+
+def make_signer(tmp_path, ipsw):
+    """Create a signer whose working and output dirs live under tmp_path."""
+    signer = IPSWSigner(ipsw, tmp_path / "cert.pem", tmp_path / "key.pem")
+    signer.work_dir = tmp_path / "work"
+    signer.output_dir = tmp_path / "out"
+    return signer
+
+
+@pytest.mark.parametrize("chunk_size", [IPSWSigner.EXTRACT_CHUNK_SIZE, 4096])
+def test_extract_and_repack_round_trip(tmp_path, chunk_size):
+    """Extracting then repacking preserves every file and directory."""
+    ipsw = make_ipsw(tmp_path / "test.ipsw")
+    signer = make_signer(tmp_path, ipsw)
+    # A small chunk size sends most members through the streaming path
+    signer.EXTRACT_CHUNK_SIZE = chunk_size
+
+    signer.extract_ipsw()
+    expected = tmp_path / "expected"
+    with zipfile.ZipFile(ipsw) as archive:
+        archive.extractall(expected)
+    for name, (data, _) in MEMBERS.items():
+        assert (signer.work_dir / name).read_bytes() == data
+    for name in DIRECTORIES:
+        assert (signer.work_dir / name).is_dir()
+    assert sorted(p.relative_to(signer.work_dir) for p in signer.work_dir.rglob("*")) == \
+        sorted(p.relative_to(expected) for p in expected.rglob("*"))
+
+    signer.repack_ipsw()
+    with zipfile.ZipFile(signer.output_dir / "LilithOS_test.ipsw") as repacked:
+        assert repacked.testzip() is None
+        names = set(repacked.namelist())
+        assert names == set(MEMBERS) | set(DIRECTORIES)
+        for name, (data, _) in MEMBERS.items():
+            assert repacked.read(name) == data
+
+
+def test_extract_rejects_path_traversal(tmp_path):
+    """Members that would land outside work_dir are refused."""
+    ipsw = make_ipsw(tmp_path / "evil.ipsw", {"../evil": (b"pwned", zipfile.ZIP_STORED)}, [])
+    signer = make_signer(tmp_path, ipsw)
+
+    with pytest.raises(zipfile.BadZipFile, match="Unsafe path"):
+        signer.extract_ipsw()
+    assert not (tmp_path / "evil").exists()
+
+
+def test_extract_detects_corrupt_crc(tmp_path):
+    """A member whose data no longer matches its CRC fails extraction."""
+    payload = b"kernelcache payload " * 16
+    ipsw = make_ipsw(tmp_path / "corrupt.ipsw", {"kernelcache": (payload, zipfile.ZIP_STORED)}, [])
+    raw = bytearray(ipsw.read_bytes())
+    raw[raw.index(payload)] ^= 0xFF
+    ipsw.write_bytes(bytes(raw))
+    signer = make_signer(tmp_path, ipsw)
+
+    with pytest.raises(zipfile.BadZipFile, match="CRC mismatch"):
+        signer.extract_ipsw()
+
+
+@pytest.mark.parametrize("chunk_size", [IPSWSigner.EXTRACT_CHUNK_SIZE, 4096])
+def test_extract_detects_understated_size(tmp_path, chunk_size):
+    """A member that inflates past its declared file_size is rejected."""
+    ipsw = make_ipsw(tmp_path / "bomb.ipsw", {"bomb.dmg": (bytes(1 << 20), zipfile.ZIP_DEFLATED)}, [])
+    patch_central_header(ipsw, 24, "<L", 1000)
+    signer = make_signer(tmp_path, ipsw)
+    signer.EXTRACT_CHUNK_SIZE = chunk_size
+
+    with pytest.raises(zipfile.BadZipFile, match="Size mismatch"):
+        signer.extract_ipsw()
+
+
+def test_extract_bounds_memory_for_understated_size(tmp_path):
+    """Inflating a member that lies about its size never buffers the whole thing."""
+    ipsw = make_ipsw(tmp_path / "bomb.ipsw", {"bomb.dmg": (bytes(32 << 20), zipfile.ZIP_DEFLATED)}, [])
+    patch_central_header(ipsw, 24, "<L", 1000)
+    signer = make_signer(tmp_path, ipsw)
+
+    tracemalloc.start()
+    try:
+        with pytest.raises(zipfile.BadZipFile, match="Size mismatch"):
+            signer.extract_ipsw()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert peak < 4 * IPSWSigner.EXTRACT_CHUNK_SIZE
+
+
+def test_extract_reports_corrupt_deflate_stream(tmp_path):
+    """Undecodable DEFLATE data surfaces as BadZipFile, not a zlib error."""
+    ipsw = make_ipsw(tmp_path / "garbage.ipsw", {"garbage": (b"\xff" * 64, zipfile.ZIP_STORED)}, [])
+    # Relabel the stored bytes as DEFLATE; 0xff starts an invalid block type
+    patch_central_header(ipsw, 10, "<H", zipfile.ZIP_DEFLATED)
+    signer = make_signer(tmp_path, ipsw)
+
+    with pytest.raises(zipfile.BadZipFile, match="Corrupt data"):
+        signer.extract_ipsw()
+
+
+def test_run_stops_extraction_when_signing_fails(tmp_path, monkeypatch):
+    """A signing error cancels the members still queued for extraction."""
+    members = {"kernelcache": (b"kernel", zipfile.ZIP_STORED)}
+    members.update((f"Firmware/{i:03}.bin", (b"filler", zipfile.ZIP_STORED)) for i in range(200))
+    ipsw = make_ipsw(tmp_path / "test.ipsw", members, ["Firmware/"])
+    for name in ("cert.pem", "key.pem"):
+        (tmp_path / name).write_bytes(b"")
+    signer = make_signer(tmp_path, ipsw)
+    signer.EXTRACT_WORKERS = 1
+
+    extract_entry = signer._extract_entry
+
+    def slow_extract(source, info, target):
+        if info.filename != "kernelcache":
+            time.sleep(0.01)
+        extract_entry(source, info, target)
+
+    def fail_sign(data, component_type):
+        raise RuntimeError("signing failed")
+
+    monkeypatch.setattr(signer, "_extract_entry", slow_extract)
+    monkeypatch.setattr(signer, "_sign_file", fail_sign)
+
+    with pytest.raises(RuntimeError, match="signing failed"):
+        signer.run()
+    assert signer._extract_pools == ()
+    assert len(list((signer.work_dir / "Firmware").iterdir())) < 50
+
+
+def test_cleanup_unlinks_symlinked_work_dir(tmp_path):
+    """A symlinked work_dir is removed without emptying its target."""
+    target = tmp_path / "target"
+    (target / "Firmware").mkdir(parents=True)
+    (target / "Firmware" / "keep.bin").write_bytes(b"keep")
+    signer = make_signer(tmp_path, tmp_path / "unused.ipsw")
+    signer.work_dir.symlink_to(target, target_is_directory=True)
+
+    signer.cleanup()
+    assert not os.path.lexists(signer.work_dir)
+    assert (target / "Firmware" / "keep.bin").read_bytes() == b"keep"
+
+
+def test_inputs_keep_symlink_names(tmp_path, monkeypatch):
+    """Relative and absolute inputs map to the same unresolved absolute path."""
+    (tmp_path / "real.ipsw").write_bytes(b"")
+    (tmp_path / "latest.ipsw").symlink_to(tmp_path / "real.ipsw")
+    monkeypatch.chdir(tmp_path)
+
+    relative = IPSWSigner("latest.ipsw", "cert.pem", "key.pem")
+    absolute = IPSWSigner(tmp_path / "latest.ipsw", tmp_path / "cert.pem", tmp_path / "key.pem")
+    assert relative.ipsw_path == absolute.ipsw_path == tmp_path / "latest.ipsw"
+    assert relative.cert_path == absolute.cert_path
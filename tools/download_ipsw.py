@@ -11,6 +11,9 @@ import requests
 import hashlib
 import argparse
 import logging
+import queue
+import shutil
+import threading
 from pathlib import Path
 from typing import Dict, Optional
 from rich.console import Console
@@ -25,6 +28,19 @@ logger = logging.getLogger(__name__)
 
 console = Console()
 
+class _ProgressWriter:
+    """Binary file wrapper that advances a rich progress task on every write."""
+    
+    def __init__(self, fileobj, progress: Progress, task):
+        self._fileobj = fileobj
+        self._progress = progress
+        self._task = task
+    
+    def write(self, data) -> int:
+        size = self._fileobj.write(data)
+        self._progress.update(self._task, advance=size)
+        return size
+
 class IPSWDownloader:
     """Downloads iOS IPSW files with progress tracking and verification."""
     
@@ -40,11 +56,26 @@ class IPSWDownloader:
         }
     }
     
+    # Marketing names for the device identifiers above
+    DEVICE_MODELS = {
+        "iPhone14,2": "iPhone 13 Pro Max",
+    }
+    
+    # Download copy size
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+    
+    # Marker for IPSWs whose real hash hasn't been filled in yet
+    PLACEHOLDER_SHA256 = "placeholder_sha256_hash_here"
+    
+    # Hashing reads the IPSW in large chunks, keeping a few read ahead
+    HASH_CHUNK_SIZE = 4 * 1024 * 1024
+    HASH_READ_AHEAD = 4
+    
     def __init__(self, device: str, version: str, output_dir: str = "downloads"):
         self.device = device
         self.version = version
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
         
         # Validate device and version
         if device not in self.IPSW_URLS:
@@ -60,8 +91,11 @@ class IPSWDownloader:
         """Download the IPSW file with progress tracking."""
         console.print(Panel(f"Downloading iOS {self.version} for {self.device}", style="bold blue"))
         
+        # Stat the partial file once and reuse its size below
+        existing_size = self._existing_size() if resume else None
+        
         # Check if file already exists
-        if self.filepath.exists() and resume:
+        if existing_size is not None:
             console.print(f"File already exists: {self.filepath}")
             if self.verify_file():
                 console.print("✅ File is complete and verified!", style="bold green")
@@ -72,11 +106,10 @@ class IPSWDownloader:
         # Start download
         try:
             headers = {}
-            if resume and self.filepath.exists():
+            if existing_size is not None:
                 # Resume download
-                file_size = self.filepath.stat().st_size
-                headers['Range'] = f'bytes={file_size}-'
-                console.print(f"Resuming download from byte {file_size}")
+                headers['Range'] = f'bytes={existing_size}-'
+                console.print(f"Resuming download from byte {existing_size}")
             
             response = requests.get(self.ipsw_info['url'], 
                                   headers=headers, 
@@ -86,8 +119,8 @@ class IPSWDownloader:
             
             # Get total size
             total_size = int(response.headers.get('content-length', 0))
-            if resume and self.filepath.exists():
-                total_size += self.filepath.stat().st_size
+            if existing_size is not None:
+                total_size += existing_size
             
             # Download with progress bar
             with Progress(
@@ -104,12 +137,16 @@ class IPSWDownloader:
                     total=total_size
                 )
                 
-                mode = 'ab' if resume and self.filepath.exists() else 'wb'
-                with open(self.filepath, mode) as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                            progress.update(task, advance=len(chunk))
+                # Copy the raw stream, decoding only if the server compressed it
+                response.raw.decode_content = 'content-encoding' in response.headers
+                
+                mode = 'ab' if existing_size is not None else 'wb'
+                with open(self.filepath, mode, buffering=self.DOWNLOAD_CHUNK_SIZE) as f:
+                    shutil.copyfileobj(
+                        response.raw,
+                        _ProgressWriter(f, progress, task),
+                        self.DOWNLOAD_CHUNK_SIZE
+                    )
             
             console.print("✅ Download completed!", style="bold green")
             
@@ -128,23 +165,35 @@ class IPSWDownloader:
             console.print(f"❌ Unexpected error: {e}", style="bold red")
             return False
     
+    def _existing_size(self) -> Optional[int]:
+        """Return the size of the downloaded file, or None if it doesn't exist."""
+        try:
+            return self.filepath.stat().st_size
+        except FileNotFoundError:
+            return None
+    
     def verify_file(self) -> bool:
         """Verify the downloaded file integrity."""
-        if not self.filepath.exists():
+        file_size = self._existing_size()
+        if file_size is None:
             return False
         
         console.print("🔍 Verifying file integrity...")
         
         # Check file size
-        file_size = self.filepath.stat().st_size
         expected_size = self.ipsw_info['size']
         
         if abs(file_size - expected_size) > 1024:  # Allow 1KB difference
             console.print(f"⚠️ File size mismatch: {file_size} vs {expected_size}", style="yellow")
             return False
         
+        # Without a configured hash there is nothing to compare against
+        expected_hash = self.ipsw_info['sha256']
+        if expected_hash == self.PLACEHOLDER_SHA256:
+            console.print("⚠️ No hash configured; skipping SHA256", style="yellow")
+            return True
+        
         # Calculate SHA256 hash
-        sha256_hash = hashlib.sha256()
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -154,30 +203,73 @@ class IPSWDownloader:
         ) as progress:
             task = progress.add_task("Calculating SHA256...", total=file_size)
             
-            with open(self.filepath, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(chunk)
-                    progress.update(task, advance=len(chunk))
+            sha256_hash = self._sha256(progress, task)
         
         calculated_hash = sha256_hash.hexdigest()
-        expected_hash = self.ipsw_info['sha256']
-        
-        if expected_hash != "placeholder_sha256_hash_here":
-            if calculated_hash != expected_hash:
-                console.print(f"❌ SHA256 mismatch!", style="bold red")
-                console.print(f"Expected: {expected_hash}")
-                console.print(f"Calculated: {calculated_hash}")
-                return False
+        if calculated_hash != expected_hash:
+            console.print(f"❌ SHA256 mismatch!", style="bold red")
+            console.print(f"Expected: {expected_hash}")
+            console.print(f"Calculated: {calculated_hash}")
+            return False
         
         console.print("✅ File integrity verified!", style="bold green")
         return True
     
+    def _sha256(self, progress: Progress, task) -> "hashlib._Hash":
+        """Hash the IPSW while a reader thread reads ahead.
+
+        The reader fills a fixed ring of large buffers while this thread feeds
+        them to SHA-256 (which releases the GIL), so disk reads and hashing
+        overlap instead of alternating. If hashing stops early the reader is
+        told to stop, so it never outlives this call holding the file open.
+        """
+        free_buffers: "queue.Queue[Optional[bytearray]]" = queue.Queue()
+        filled: queue.Queue = queue.Queue()
+        stop = threading.Event()
+        for _ in range(self.HASH_READ_AHEAD + 2):
+            free_buffers.put(bytearray(self.HASH_CHUNK_SIZE))
+        
+        def read_ahead():
+            try:
+                with open(self.filepath, 'rb', buffering=0) as f:
+                    while True:
+                        buffer = free_buffers.get()
+                        if buffer is None or stop.is_set():
+                            return
+                        size = f.readinto(buffer)
+                        filled.put((buffer, size))
+                        if not size:
+                            return
+            except Exception as e:
+                filled.put((None, e))
+        
+        reader = threading.Thread(target=read_ahead, name="sha256-read-ahead", daemon=True)
+        reader.start()
+        
+        sha256_hash = hashlib.sha256()
+        try:
+            while True:
+                buffer, size = filled.get()
+                if buffer is None:
+                    raise size
+                if not size:
+                    break
+                sha256_hash.update(memoryview(buffer)[:size])
+                free_buffers.put(buffer)
+                progress.update(task, advance=size)
+        finally:
+            # Wake the reader if it is waiting for a buffer and let it exit
+            stop.set()
+            free_buffers.put(None)
+            reader.join()
+        return sha256_hash
+    
     def get_file_info(self) -> Dict:
         """Get information about the downloaded file."""
-        if not self.filepath.exists():
+        file_size = self._existing_size()
+        if file_size is None:
             return {}
         
-        file_size = self.filepath.stat().st_size
         return {
             "filename": self.filename,
             "filepath": str(self.filepath),
@@ -198,16 +290,14 @@ def list_available_devices():
     table.add_column("Build", style="yellow")
     table.add_column("Size (GB)", style="blue")
     
-    for device, versions in IPSWDownloader.IPSW_URLS.items():
-        for version, info in versions.items():
-            size_gb = info['size'] / (1024 * 1024 * 1024)
-            table.add_row(
-                device,
-                "iPhone 13 Pro Max" if device == "iPhone14,2" else device,
-                version,
-                info['build'],
-                f"{size_gb:.1f}"
-            )
+    rows = (
+        (device, IPSWDownloader.DEVICE_MODELS.get(device, device), version, info)
+        for device, versions in IPSWDownloader.IPSW_URLS.items()
+        for version, info in versions.items()
+    )
+    for device, model, version, info in rows:
+        size_gb = info['size'] / (1024 * 1024 * 1024)
+        table.add_row(device, model, version, info['build'], f"{size_gb:.1f}")
     
     console.print(table)
 
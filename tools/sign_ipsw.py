@@ -2,24 +2,113 @@
 
 import os
 import sys
+import mmap
 import plistlib
-import subprocess
+import shutil
+import stat
+import struct
+import tempfile
+import time
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
+from typing import Union
 import argparse
 import logging
 
+try:
+    from isal import isal_zlib
+except ImportError:  # ISA-L is optional; fall back to the standard zlib module
+    isal_zlib = None
+
+# DEFLATE and CRC-32 for extraction and repacking; ISA-L's SIMD implementation
+# is a drop-in replacement for zlib's raw-deflate API
+_deflate = isal_zlib if isal_zlib is not None else zlib
+
 # Configure logging
 logging.basicConfig(level=logging.INFO,
                    format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+PathLike = Union[str, os.PathLike]
+
+def _as_path(path: PathLike) -> Path:
+    """Return path as an absolute Path, leaving symlinks unresolved."""
+    return Path(os.path.abspath(path))
+
+# ZIP local file header: signature, version, flags, method, time, date,
+# crc32, compressed size, uncompressed size, name length, extra length
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_CENTRAL_HEADER = struct.Struct("<4s6H3L5H2L")
+_END_OF_CENTRAL_DIR = struct.Struct("<4s4H2LH")
+_ZIP64_END_OF_CENTRAL_DIR = struct.Struct("<4sQ2H2L4Q")
+_ZIP64_LOCATOR = struct.Struct("<4sLQL")
+_ZIP32_LIMIT = 0xFFFFFFFF
+
+def _dos_timestamp(mtime):
+    """Convert a POSIX mtime into ZIP (DOS) time and date fields."""
+    t = time.localtime(mtime)
+    if t.tm_year < 1980:
+        return 0, (1 << 5) | 1
+    return ((t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2),
+            ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday)
+
+if hasattr(os, "pread"):
+    _pread = os.pread
+else:
+    def _pread(fd, size, offset):
+        """Positional read for platforms without os.pread (each fd is per-thread)."""
+        os.lseek(fd, offset, os.SEEK_SET)
+        return os.read(fd, size)
+
+if hasattr(os, "posix_fadvise"):
+    def _prefetch(fd, offset, size):
+        """Queue asynchronous kernel read-ahead for a byte range."""
+        if size > 0:
+            os.posix_fadvise(fd, offset, size, os.POSIX_FADV_WILLNEED)
+else:
+    def _prefetch(fd, offset, size):
+        """No read-ahead hints available on this platform."""
+
 class IPSWSigner:
-    def __init__(self, ipsw_path, cert_path, key_path):
-        self.ipsw_path = Path(ipsw_path)
-        self.cert_path = Path(cert_path)
-        self.key_path = Path(key_path)
+    # Entries above this size are extracted on a separate pool so that the
+    # multi-GB images don't hold up the many small firmware files
+    LARGE_ENTRY_SIZE = 64 * 1024 * 1024
+    EXTRACT_CHUNK_SIZE = 1024 * 1024
+    EXTRACT_WORKERS = min(os.cpu_count() or 1, 12)
+
+    # Repacking deflates members on worker threads into spool files that stay
+    # in memory up to SPOOL_SIZE, with a bounded number in flight. ISA-L only
+    # has levels 0-3, of which 3 is the closest to zlib's default of 6
+    COMPRESS_LEVEL = 3 if isal_zlib is not None else 6
+    SPOOL_SIZE = 64 * 1024 * 1024
+
+    CLEANUP_WORKERS = 16
+
+    # Components to sign, in order, as (file name, component type)
+    COMPONENTS = [
+        ("kernelcache", "kernel"),
+        ("DeviceTree", "device-tree"),
+        ("iBSS", "ibss"),
+        ("iBEC", "ibec"),
+        ("LLB", "llb"),
+        ("iBoot", "iboot"),
+    ]
+    LOAD_WORKERS = 8
+
+    def __init__(self, ipsw_path: PathLike, cert_path: PathLike, key_path: PathLike):
+        self.ipsw_path = _as_path(ipsw_path)
+        self.cert_path = _as_path(cert_path)
+        self.key_path = _as_path(key_path)
         self.work_dir = Path("work")
         self.output_dir = Path("build")
+        # Background extraction state, see extract_ipsw(wait=False)
+        self._extract_pools = ()
+        self._extracting = {}
 
     def verify_inputs(self):
         """Verify that all required files exist."""
@@ -30,35 +119,223 @@ class IPSWSigner:
         if not self.key_path.exists():
             raise FileNotFoundError(f"Key file not found: {self.key_path}")
 
-    def extract_ipsw(self):
-        """Extract the IPSW contents."""
+    def extract_ipsw(self, wait=True):
+        """Extract the IPSW contents.
+
+        With wait=False extraction carries on in the background, and
+        sign_components/repack_ipsw wait for just the members they need.
+        """
         logger.info("Extracting IPSW...")
         self.work_dir.mkdir(exist_ok=True)
-        subprocess.run(["unzip", "-q", str(self.ipsw_path), "-d", str(self.work_dir)],
-                      check=True)
+        # Every worker opens the archive itself, so convert its path just once
+        source = os.fspath(self.ipsw_path)
+        with zipfile.ZipFile(source) as ipsw:
+            entries = ipsw.infolist()
+
+        # Create every directory up front so workers only ever write files
+        root = self.work_dir.resolve()
+        small, large = [], []
+        for info in entries:
+            target = self._entry_path(root, info.filename)
+            if info.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if info.file_size > self.LARGE_ENTRY_SIZE:
+                large.append((info, target))
+            else:
+                small.append((info, target))
+
+        # Queue the signing components first so signing can start early
+        components = {name for name, _ in self.COMPONENTS}
+        large.sort(key=lambda item: item[0].filename not in components)
+        small.sort(key=lambda item: item[0].filename not in components)
+
+        small_pool = ThreadPoolExecutor(max_workers=self.EXTRACT_WORKERS,
+                                        thread_name_prefix="extract")
+        large_pool = ThreadPoolExecutor(max_workers=self.EXTRACT_WORKERS,
+                                        thread_name_prefix="extract-large")
+        self._extract_pools = (small_pool, large_pool)
+        self._extracting = {}
+        for pool, members in ((large_pool, large), (small_pool, small)):
+            for info, target in members:
+                self._extracting[info.filename] = pool.submit(self._extract_entry, source, info, target)
+
+        if wait:
+            self._wait_for_extraction()
+
+    def _wait_for_extraction(self, names=None):
+        """Block until the named members (default: all of them) are extracted."""
+        if names is None:
+            futures = list(self._extracting.values())
+        else:
+            futures = [self._extracting[name] for name in names if name in self._extracting]
+        try:
+            for future in futures:
+                future.result()
+        except BaseException:
+            # Stop the rest of the extraction; the error is reported once
+            self._stop_extraction(cancel=True)
+            raise
+        if names is None:
+            self._stop_extraction()
+
+    def _stop_extraction(self, cancel=False):
+        """Shut down the extraction pools, optionally dropping queued members."""
+        for pool in self._extract_pools:
+            pool.shutdown(wait=True, cancel_futures=cancel)
+        self._extract_pools = ()
+        self._extracting = {}
+
+    @staticmethod
+    def _entry_path(root, name):
+        """Map an archive member name into root, rejecting paths that escape it."""
+        target = Path(os.path.normpath(root / name))
+        if target != root and root not in target.parents:
+            raise zipfile.BadZipFile(f"Unsafe path in IPSW: {name}")
+        return target
+
+    def _extract_entry(self, source, info, target):
+        """Extract one member by reading its payload directly with pread."""
+        if info.flag_bits & 0x1 or info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            # Encrypted or unusual compression, let zipfile handle it
+            with zipfile.ZipFile(source) as ipsw, \
+                 ipsw.open(info) as src, open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst, self.EXTRACT_CHUNK_SIZE)
+            return
+
+        fd = os.open(source, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            header = _pread(fd, _LOCAL_HEADER.size, info.header_offset)
+            if len(header) != _LOCAL_HEADER.size or header[:4] != b"PK\x03\x04":
+                raise zipfile.BadZipFile(f"Bad local header for {info.filename}")
+            name_len, extra_len = _LOCAL_HEADER.unpack(header)[-2:]
+            offset = info.header_offset + _LOCAL_HEADER.size + name_len + extra_len
+
+            deflated = info.compress_type == zipfile.ZIP_DEFLATED
+            remaining = info.compress_size
+            written = 0
+            with open(target, "wb") as dst:
+                try:
+                    decompressor = _deflate.decompressobj(-15) if deflated else None
+                    if max(remaining, info.file_size) <= self.EXTRACT_CHUNK_SIZE:
+                        # Most firmware files fit in a chunk both ways; read and
+                        # inflate them with one call each, capping the output one
+                        # byte past the declared size so overruns are still caught
+                        payload = _pread(fd, remaining, offset)
+                        if len(payload) != remaining:
+                            raise zipfile.BadZipFile(f"Truncated data for {info.filename}")
+                        data = decompressor.decompress(payload, info.file_size + 1) if decompressor else payload
+                        crc = _deflate.crc32(data)
+                        written = len(data)
+                        dst.write(data)
+                    else:
+                        crc = 0
+                        _prefetch(fd, offset, self.EXTRACT_CHUNK_SIZE)
+                        while remaining:
+                            # Have the kernel fetch the next chunk while this one decompresses
+                            size = min(self.EXTRACT_CHUNK_SIZE, remaining)
+                            _prefetch(fd, offset + size, min(self.EXTRACT_CHUNK_SIZE, remaining - size))
+                            chunk = _pread(fd, size, offset)
+                            if not chunk:
+                                raise zipfile.BadZipFile(f"Truncated data for {info.filename}")
+                            offset += len(chunk)
+                            remaining -= len(chunk)
+                            # Inflate at most one chunk at a time so highly
+                            # compressible members can't balloon worker memory
+                            pending = chunk
+                            while pending:
+                                if decompressor:
+                                    data = decompressor.decompress(pending, self.EXTRACT_CHUNK_SIZE)
+                                    pending = decompressor.unconsumed_tail
+                                else:
+                                    data, pending = pending, b""
+                                written += len(data)
+                                # Stop as soon as the member outgrows its declared size
+                                if written > info.file_size:
+                                    raise zipfile.BadZipFile(f"Size mismatch for {info.filename}")
+                                crc = _deflate.crc32(data, crc)
+                                dst.write(data)
+                    if decompressor and written <= info.file_size:
+                        data = decompressor.flush()
+                        crc = _deflate.crc32(data, crc)
+                        written += len(data)
+                        dst.write(data)
+                        if not decompressor.eof:
+                            raise zipfile.BadZipFile(f"Truncated data for {info.filename}")
+                except _deflate.error as exc:
+                    raise zipfile.BadZipFile(f"Corrupt data for {info.filename}: {exc}") from exc
+        finally:
+            os.close(fd)
+
+        if written != info.file_size:
+            raise zipfile.BadZipFile(f"Size mismatch for {info.filename}")
+        if crc != info.CRC:
+            raise zipfile.BadZipFile(f"CRC mismatch for {info.filename}")
 
     def sign_components(self):
         """Sign individual components of the IPSW."""
         logger.info("Signing components...")
         
-        # Sign kernel
-        kernel_path = self.work_dir / "kernelcache"
-        if kernel_path.exists():
-            self._sign_file(kernel_path, "kernel")
-
-        # Sign device tree
-        device_tree_path = self.work_dir / "DeviceTree"
-        if device_tree_path.exists():
-            self._sign_file(device_tree_path, "device-tree")
-
-        # Sign other components as needed
-        for component in ["iBSS", "iBEC", "LLB", "iBoot"]:
-            component_path = self.work_dir / component
-            if component_path.exists():
-                self._sign_file(component_path, component.lower())
-
-    def _sign_file(self, file_path, component_type):
-        """Sign a single file with the appropriate component type."""
+        self._wait_for_extraction([name for name, _ in self.COMPONENTS])
+
+        # Read every component into one buffer, then sign the kernel, device
+        # tree and boot chain from memory
+        paths = [self.work_dir / name for name, _ in self.COMPONENTS]
+        with self._load_components_packed(paths) as views:
+            for (_, component_type), data in zip(self.COMPONENTS, views):
+                if data is not None:
+                    self._sign_file(data, component_type)
+
+    @contextmanager
+    def _load_components_packed(self, paths):
+        """Load files into one anonymous mmap, yielding a memoryview per path.
+
+        Missing files get None. Files are read in parallel straight into their
+        slice of the mapping, and the views are released on exit.
+        """
+        sizes = []
+        for path in paths:
+            try:
+                sizes.append(os.stat(path).st_size)
+            except FileNotFoundError:
+                sizes.append(None)
+
+        packed = mmap.mmap(-1, max(sum(size or 0 for size in sizes), 1))
+        buffer = memoryview(packed)
+        views, offset = [], 0
+        for size in sizes:
+            if size is None:
+                views.append(None)
+                continue
+            views.append(buffer[offset:offset + size])
+            offset += size
+
+        def load(path, view):
+            with open(path, "rb", buffering=0) as f:
+                filled = 0
+                while filled < len(view):
+                    n = f.readinto(view[filled:])
+                    if not n:
+                        raise EOFError(f"{path} shrank while loading")
+                    filled += n
+
+        try:
+            loads = [(path, view) for path, view in zip(paths, views) if view is not None]
+            if loads:
+                with ThreadPoolExecutor(max_workers=min(len(loads), self.LOAD_WORKERS),
+                                        thread_name_prefix="load") as pool:
+                    list(pool.map(lambda item: load(*item), loads))
+            yield views
+        finally:
+            for view in views:
+                if view is not None:
+                    view.release()
+            buffer.release()
+            packed.close()
+
+    def _sign_file(self, data, component_type):
+        """Sign a single component's contents with the appropriate component type."""
         logger.info(f"Signing {component_type}...")
         # TODO: Implement actual signing process using Apple's signing tools
         # This is a placeholder for the actual implementation
@@ -67,22 +344,175 @@ class IPSWSigner:
     def repack_ipsw(self):
         """Repack the signed components into a new IPSW."""
         logger.info("Repacking IPSW...")
+        self._wait_for_extraction()
         self.output_dir.mkdir(exist_ok=True)
         output_ipsw = self.output_dir / f"LilithOS_{self.ipsw_path.name}"
         
-        # Create the new IPSW
-        subprocess.run(["zip", "-r", str(output_ipsw), "."],
-                      cwd=str(self.work_dir),
-                      check=True)
+        # Compress members in parallel and write them out in walk order
+        members = iter(self._repack_members())
+        central = []
+        with ThreadPoolExecutor(max_workers=self.EXTRACT_WORKERS,
+                                thread_name_prefix="compress") as pool, \
+             open(output_ipsw, "wb") as out:
+            pending = deque((name, path, pool.submit(self._compress_member, path))
+                            for name, path in islice(members, self.EXTRACT_WORKERS * 2))
+            while pending:
+                name, path, future = pending.popleft()
+                for next_name, next_path in islice(members, 1):
+                    pending.append((next_name, next_path, pool.submit(self._compress_member, next_path)))
+                central.append(self._write_member(out, name, *future.result()))
+            self._write_central_directory(out, central)
         
         logger.info(f"Signed IPSW created: {output_ipsw}")
 
+    def _repack_members(self):
+        """List (archive name, path) pairs under work_dir, directories included."""
+        members = []
+        for dirpath, dirnames, filenames in os.walk(self.work_dir):
+            dirnames.sort()
+            rel = Path(dirpath).relative_to(self.work_dir).as_posix()
+            prefix = "" if rel == "." else rel + "/"
+            if prefix:
+                members.append((prefix, Path(dirpath)))
+            members.extend((prefix + filename, Path(dirpath, filename))
+                           for filename in sorted(filenames))
+        return members
+
+    def _compress_member(self, path):
+        """Deflate one file (or nothing, for a directory) into a spool file."""
+        st = path.stat()
+        if stat.S_ISDIR(st.st_mode):
+            return st, zipfile.ZIP_STORED, 0, 0, None
+        compressor = _deflate.compressobj(self.COMPRESS_LEVEL, zlib.DEFLATED, -15)
+        spool = tempfile.SpooledTemporaryFile(max_size=self.SPOOL_SIZE)
+        crc = 0
+        with open(path, "rb") as src:
+            for chunk in iter(lambda: src.read(self.EXTRACT_CHUNK_SIZE), b""):
+                crc = _deflate.crc32(chunk, crc)
+                spool.write(compressor.compress(chunk))
+        spool.write(compressor.flush())
+        spool.seek(0)
+        return st, zipfile.ZIP_DEFLATED, crc, st.st_size, spool
+
+    def _write_member(self, out, name, st, method, crc, size, spool):
+        """Write a local header and payload, returning its central directory record."""
+        offset = out.tell()
+        compressed_size = spool.seek(0, os.SEEK_END) if spool else 0
+        dos_time, dos_date = _dos_timestamp(st.st_mtime)
+        encoded = name.encode("utf-8")
+        flags = 0 if encoded.isascii() else 0x800
+        zip64 = size >= _ZIP32_LIMIT or compressed_size >= _ZIP32_LIMIT
+        version = 45 if zip64 else 20
+        extra = struct.pack("<2H2Q", 0x0001, 16, size, compressed_size) if zip64 else b""
+        out.write(_LOCAL_HEADER.pack(
+            b"PK\x03\x04", version, flags, method, dos_time, dos_date, crc,
+            _ZIP32_LIMIT if zip64 else compressed_size,
+            _ZIP32_LIMIT if zip64 else size,
+            len(encoded), len(extra)))
+        out.write(encoded)
+        out.write(extra)
+        if spool:
+            spool.seek(0)
+            shutil.copyfileobj(spool, out, self.EXTRACT_CHUNK_SIZE)
+            spool.close()
+        external = (st.st_mode & 0xFFFF) << 16 | (0x10 if stat.S_ISDIR(st.st_mode) else 0)
+        return (encoded, flags, method, dos_time, dos_date, crc,
+                compressed_size, size, external, offset)
+
+    @staticmethod
+    def _write_central_directory(out, central):
+        """Write the central directory and end records, using ZIP64 when needed."""
+        cd_offset = out.tell()
+        for encoded, flags, method, dos_time, dos_date, crc, compressed_size, size, external, offset in central:
+            # ZIP64 extra fields carry only the values that overflow, in this order
+            wide = [value for value in (size, compressed_size, offset) if value >= _ZIP32_LIMIT]
+            extra = struct.pack(f"<2H{len(wide)}Q", 0x0001, 8 * len(wide), *wide) if wide else b""
+            version = 45 if wide else 20
+            out.write(_CENTRAL_HEADER.pack(
+                b"PK\x01\x02", (3 << 8) | version, version, flags, method, dos_time, dos_date, crc,
+                min(compressed_size, _ZIP32_LIMIT), min(size, _ZIP32_LIMIT),
+                len(encoded), len(extra), 0, 0, 0, external, min(offset, _ZIP32_LIMIT)))
+            out.write(encoded)
+            out.write(extra)
+        cd_size = out.tell() - cd_offset
+        count = len(central)
+
+        if count >= 0xFFFF or cd_size >= _ZIP32_LIMIT or cd_offset >= _ZIP32_LIMIT:
+            zip64_offset = out.tell()
+            out.write(_ZIP64_END_OF_CENTRAL_DIR.pack(
+                b"PK\x06\x06", _ZIP64_END_OF_CENTRAL_DIR.size - 12, (3 << 8) | 45, 45,
+                0, 0, count, count, cd_size, cd_offset))
+            out.write(_ZIP64_LOCATOR.pack(b"PK\x06\x07", 0, zip64_offset, 1))
+        out.write(_END_OF_CENTRAL_DIR.pack(
+            b"PK\x05\x06", 0, 0, min(count, 0xFFFF), min(count, 0xFFFF),
+            min(cd_size, _ZIP32_LIMIT), min(cd_offset, _ZIP32_LIMIT), 0))
+
+    def run(self):
+        """Extract, sign and repack the IPSW, then clean up."""
+        self.verify_inputs()
+        # Signing starts as soon as its components are out of the archive
+        self.extract_ipsw(wait=False)
+        try:
+            self.sign_components()
+            self.repack_ipsw()
+        except BaseException:
+            # Drop whatever is still queued instead of extracting it on exit
+            self._stop_extraction(cancel=True)
+            raise
+        self.cleanup()
+
     def cleanup(self):
         """Clean up temporary files."""
         logger.info("Cleaning up...")
+        self._wait_for_extraction()
         if self.work_dir.exists():
-            subprocess.run(["rm", "-rf", str(self.work_dir)],
-                         check=True)
+            self._parallel_rmtree(self.work_dir)
+
+    def _parallel_rmtree(self, root):
+        """Remove a directory tree, unlinking files from several threads at once.
+
+        Directories are scanned a level at a time across the pool, each worker
+        unlinking the files it finds; the emptied directories are then removed
+        deepest level first. Symlinks are unlinked, never followed, and other
+        filesystems mounted inside the tree are left alone. Errors are ignored,
+        as with shutil.rmtree(ignore_errors=True).
+        """
+        root = os.fspath(root)
+        if os.path.islink(root):
+            # A symlinked root is removed like any other link, not emptied
+            os.unlink(root)
+            return
+        device = os.lstat(root).st_dev
+
+        def scan(path):
+            subdirs = []
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        try:
+                            if not entry.is_dir(follow_symlinks=False):
+                                os.unlink(entry.path)
+                            elif entry.stat(follow_symlinks=False).st_dev == device:
+                                subdirs.append(entry.path)
+                        except OSError:
+                            pass
+            except OSError:
+                pass
+            return subdirs
+
+        def remove_dir(path):
+            try:
+                os.rmdir(path)
+            except OSError:
+                pass
+
+        levels = [[root]]
+        with ThreadPoolExecutor(max_workers=self.CLEANUP_WORKERS,
+                                thread_name_prefix="cleanup") as pool:
+            while levels[-1]:
+                levels.append([subdir for subdirs in pool.map(scan, levels[-1]) for subdir in subdirs])
+            for level in reversed(levels):
+                list(pool.map(remove_dir, level))
 
 def main():
     parser = argparse.ArgumentParser(description="Sign an IPSW for LilithOS")
@@ -94,11 +524,7 @@ def main():
     
     try:
         signer = IPSWSigner(args.ipsw, args.cert, args.key)
-        signer.verify_inputs()
-        signer.extract_ipsw()
-        signer.sign_components()
-        signer.repack_ipsw()
-        signer.cleanup()
+        signer.run()
         logger.info("IPSW signing completed successfully!")
     except Exception as e:
         logger.error(f"Error during IPSW signing: {e}")
@@ -10,27 +10,65 @@ import sys
 import time
 import json
 import argparse
+import asyncio
+import contextlib
+import functools
+import io
 import logging
 import subprocess
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.live import Live
-from rich.layout import Layout
-from rich.text import Text
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, Final, Iterable, List, Mapping, Optional, TextIO, Tuple
+from dataclasses import dataclass, asdict, field
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard json module
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO,
                    format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-console = Console()
+# Device-specific configurations, shared read-only by every framework instance
+_DEVICE_CONFIGS: Final[Mapping[str, Mapping[str, Any]]] = MappingProxyType({
+    "iPhone14,2": MappingProxyType({
+        "name": "iPhone 13 Pro Max",
+        "architecture": "ARM64",
+        "chipset": "A15 Bionic",
+        "ram": "6GB",
+        "storage_options": ("128GB", "256GB", "512GB", "1TB"),
+        "display": "6.7\" OLED, 2778x1284, 120Hz",
+        "baseband": "Qualcomm X60 5G"
+    })
+})
+
+# Report marker for each test status
+_STATUS_EMOJI: Final[Dict[str, str]] = {"PASS": "✅", "FAIL": "❌", "SKIP": "⏭️", "ERROR": "⚠️"}
+
+def _success_rate(passed: int, total: int) -> float:
+    """Percentage of tests that passed, 0 for an empty run."""
+    return passed / total * 100 if total > 0 else 0.0
+
+# Result records are immutable; drop their per-instance __dict__ where supported
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# rich is imported on first use so that --help and early errors start fast
+@functools.lru_cache(maxsize=1)
+def _get_console():
+    """Return the shared rich console."""
+    from rich.console import Console
+    return Console()
 
-@dataclass
+def _dumps_json(obj) -> bytes:
+    """Serialize a report, dataclasses included, to indented JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, default=asdict).encode()
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class TestResult:
     """Represents the result of a single test."""
     name: str
@@ -40,7 +78,7 @@ class TestResult:
     error_message: Optional[str] = None
     metrics: Optional[Dict] = None
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class TestSuite:
     """Represents a collection of related tests."""
     name: str
@@ -51,314 +89,260 @@ class TestSuite:
     failed_tests: int
     skipped_tests: int
     total_duration: float
+    success_rate: float = field(init=False)
+    
+    def __post_init__(self):
+        # Computed once; frozen slotted dataclasses can't use cached_property
+        object.__setattr__(self, "success_rate", _success_rate(self.passed_tests, self.total_tests))
+    
+    @classmethod
+    def aggregate(cls, suites: Iterable["TestSuite"]) -> "AggregatedStats":
+        """Sum test counts across suites in a single pass."""
+        total_tests = passed_tests = failed_tests = skipped_tests = 0
+        for suite in suites:
+            total_tests += suite.total_tests
+            passed_tests += suite.passed_tests
+            failed_tests += suite.failed_tests
+            skipped_tests += suite.skipped_tests
+        return AggregatedStats(total_tests, passed_tests, failed_tests, skipped_tests)
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class AggregatedStats:
+    """Test counts summed across a set of suites."""
+    total_tests: int
+    passed_tests: int
+    failed_tests: int
+    skipped_tests: int
+    success_rate: float = field(init=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "success_rate", _success_rate(self.passed_tests, self.total_tests))
 
 class LilithOSTestFramework:
     """Comprehensive testing framework for LilithOS."""
     
+    device_configs = _DEVICE_CONFIGS
+    
+    # Test categories and the methods that run them, in report order
+    SUITE_RUNNERS = {
+        "boot": ("run_boot_tests", "🧪 Boot Process Tests"),
+        "kernel": ("run_kernel_tests", "🔧 Kernel Tests"),
+        "system": ("run_system_tests", "⚙️ System Tests"),
+        "performance": ("run_performance_tests", "⚡ Performance Tests"),
+        "security": ("run_security_tests", "🔒 Security Tests"),
+    }
+    
     def __init__(self, device: str, ipsw_path: Optional[str] = None):
         self.device = device
         self.ipsw_path = Path(ipsw_path) if ipsw_path else None
         self.results: List[TestResult] = []
-        self.start_time = time.time()
-        
-        # Device-specific configurations
-        self.device_configs = {
-            "iPhone14,2": {
-                "name": "iPhone 13 Pro Max",
-                "architecture": "ARM64",
-                "chipset": "A15 Bionic",
-                "ram": "6GB",
-                "storage_options": ["128GB", "256GB", "512GB", "1TB"],
-                "display": "6.7\" OLED, 2778x1284, 120Hz",
-                "baseband": "Qualcomm X60 5G"
-            }
-        }
+        self.start_time = time.time()  # Wall clock, for the report timestamp
+        self._start_perf = time.perf_counter()
         
-        if device not in self.device_configs:
+        if device not in _DEVICE_CONFIGS:
             raise ValueError(f"Unsupported device: {device}")
-        
-        self.device_config = self.device_configs[device]
     
-    def run_boot_tests(self) -> TestSuite:
+    @property
+    def device_config(self) -> Mapping[str, Any]:
+        """Configuration for the device under test."""
+        return _DEVICE_CONFIGS[self.device]
+    
+    async def run_boot_tests(self) -> TestSuite:
         """Test the boot process and secure boot chain."""
-        console.print(Panel("🧪 Running Boot Process Tests", style="bold blue"))
-        
-        tests = []
-        start_time = time.time()
-        
-        # Test 1: IPSW Structure Validation
-        test_result = self._test_ipsw_structure()
-        tests.append(test_result)
-        
-        # Test 2: Boot Chain Integrity
-        test_result = self._test_boot_chain_integrity()
-        tests.append(test_result)
-        
-        # Test 3: Kernel Loading
-        test_result = self._test_kernel_loading()
-        tests.append(test_result)
-        
-        # Test 4: System Initialization
-        test_result = self._test_system_initialization()
-        tests.append(test_result)
-        
-        # Test 5: Boot Animation
-        test_result = self._test_boot_animation()
-        tests.append(test_result)
-        
-        duration = time.time() - start_time
-        passed = sum(1 for t in tests if t.status == "PASS")
-        failed = sum(1 for t in tests if t.status == "FAIL")
-        skipped = sum(1 for t in tests if t.status == "SKIP")
-        
-        return TestSuite(
-            name="Boot Process Tests",
-            description="Tests for secure boot chain and system initialization",
-            tests=tests,
-            total_tests=len(tests),
-            passed_tests=passed,
-            failed_tests=failed,
-            skipped_tests=skipped,
-            total_duration=duration
+        return await self._run_suite(
+            "Boot Process Tests",
+            "Tests for secure boot chain and system initialization",
+            [
+                self._test_ipsw_structure,
+                self._test_boot_chain_integrity,
+                self._test_kernel_loading,
+                self._test_system_initialization,
+                self._test_boot_animation,
+            ]
         )
     
-    def run_kernel_tests(self) -> TestSuite:
+    async def run_kernel_tests(self) -> TestSuite:
         """Test kernel modifications and integrity."""
-        console.print(Panel("🔧 Running Kernel Tests", style="bold blue"))
-        
-        tests = []
-        start_time = time.time()
-        
-        # Test 1: Kernel Binary Analysis
-        test_result = self._test_kernel_binary()
-        tests.append(test_result)
-        
-        # Test 2: Kernel Patches Validation
-        test_result = self._test_kernel_patches()
-        tests.append(test_result)
-        
-        # Test 3: System Call Modifications
-        test_result = self._test_system_calls()
-        tests.append(test_result)
-        
-        # Test 4: Memory Management
-        test_result = self._test_memory_management()
-        tests.append(test_result)
-        
-        # Test 5: Security Framework
-        test_result = self._test_security_framework()
-        tests.append(test_result)
-        
-        duration = time.time() - start_time
-        passed = sum(1 for t in tests if t.status == "PASS")
-        failed = sum(1 for t in tests if t.status == "FAIL")
-        skipped = sum(1 for t in tests if t.status == "SKIP")
-        
-        return TestSuite(
-            name="Kernel Tests",
-            description="Tests for kernel modifications and system integrity",
-            tests=tests,
-            total_tests=len(tests),
-            passed_tests=passed,
-            failed_tests=failed,
-            skipped_tests=skipped,
-            total_duration=duration
+        return await self._run_suite(
+            "Kernel Tests",
+            "Tests for kernel modifications and system integrity",
+            [
+                self._test_kernel_binary,
+                self._test_kernel_patches,
+                self._test_system_calls,
+                self._test_memory_management,
+                self._test_security_framework,
+            ]
         )
     
-    def run_system_tests(self) -> TestSuite:
+    async def run_system_tests(self) -> TestSuite:
         """Test system services and daemons."""
-        console.print(Panel("⚙️ Running System Tests", style="bold blue"))
-        
-        tests = []
-        start_time = time.time()
-        
-        # Test 1: System Daemons
-        test_result = self._test_system_daemons()
-        tests.append(test_result)
-        
-        # Test 2: Launch Daemons
-        test_result = self._test_launch_daemons()
-        tests.append(test_result)
-        
-        # Test 3: System Services
-        test_result = self._test_system_services()
-        tests.append(test_result)
-        
-        # Test 4: File System
-        test_result = self._test_file_system()
-        tests.append(test_result)
-        
-        # Test 5: Network Stack
-        test_result = self._test_network_stack()
-        tests.append(test_result)
-        
-        duration = time.time() - start_time
-        passed = sum(1 for t in tests if t.status == "PASS")
-        failed = sum(1 for t in tests if t.status == "FAIL")
-        skipped = sum(1 for t in tests if t.status == "SKIP")
-        
-        return TestSuite(
-            name="System Tests",
-            description="Tests for system services and daemon functionality",
-            tests=tests,
-            total_tests=len(tests),
-            passed_tests=passed,
-            failed_tests=failed,
-            skipped_tests=skipped,
-            total_duration=duration
+        return await self._run_suite(
+            "System Tests",
+            "Tests for system services and daemon functionality",
+            [
+                self._test_system_daemons,
+                self._test_launch_daemons,
+                self._test_system_services,
+                self._test_file_system,
+                self._test_network_stack,
+            ]
         )
     
-    def run_performance_tests(self) -> TestSuite:
+    async def run_performance_tests(self) -> TestSuite:
         """Test performance metrics and optimizations."""
-        console.print(Panel("⚡ Running Performance Tests", style="bold blue"))
-        
-        tests = []
-        start_time = time.time()
-        
-        # Test 1: Boot Time
-        test_result = self._test_boot_time()
-        tests.append(test_result)
-        
-        # Test 2: Memory Usage
-        test_result = self._test_memory_usage()
-        tests.append(test_result)
-        
-        # Test 3: CPU Performance
-        test_result = self._test_cpu_performance()
-        tests.append(test_result)
-        
-        # Test 4: Battery Life Impact
-        test_result = self._test_battery_impact()
-        tests.append(test_result)
-        
-        # Test 5: Storage Performance
-        test_result = self._test_storage_performance()
-        tests.append(test_result)
-        
-        duration = time.time() - start_time
-        passed = sum(1 for t in tests if t.status == "PASS")
-        failed = sum(1 for t in tests if t.status == "FAIL")
-        skipped = sum(1 for t in tests if t.status == "SKIP")
-        
-        return TestSuite(
-            name="Performance Tests",
-            description="Tests for performance metrics and optimizations",
-            tests=tests,
-            total_tests=len(tests),
-            passed_tests=passed,
-            failed_tests=failed,
-            skipped_tests=skipped,
-            total_duration=duration
+        return await self._run_suite(
+            "Performance Tests",
+            "Tests for performance metrics and optimizations",
+            [
+                self._test_boot_time,
+                self._test_memory_usage,
+                self._test_cpu_performance,
+                self._test_battery_impact,
+                self._test_storage_performance,
+            ]
         )
     
-    def run_security_tests(self) -> TestSuite:
+    async def run_security_tests(self) -> TestSuite:
         """Test security features and integrity."""
-        console.print(Panel("🔒 Running Security Tests", style="bold blue"))
-        
-        tests = []
-        start_time = time.time()
-        
-        # Test 1: System Integrity Protection
-        test_result = self._test_system_integrity()
-        tests.append(test_result)
-        
-        # Test 2: Code Signing
-        test_result = self._test_code_signing()
-        tests.append(test_result)
-        
-        # Test 3: Sandbox Security
-        test_result = self._test_sandbox_security()
-        tests.append(test_result)
-        
-        # Test 4: Secure Enclave
-        test_result = self._test_secure_enclave()
-        tests.append(test_result)
+        return await self._run_suite(
+            "Security Tests",
+            "Tests for security features and system integrity",
+            [
+                self._test_system_integrity,
+                self._test_code_signing,
+                self._test_sandbox_security,
+                self._test_secure_enclave,
+                self._test_network_security,
+            ]
+        )
+    
+    async def _run_suite(self, name: str, description: str,
+                         tests: List[Callable[[], Awaitable[TestResult]]]) -> TestSuite:
+        """Run a suite's independent tests concurrently and tally the results."""
+        start_time = time.perf_counter()
         
-        # Test 5: Network Security
-        test_result = self._test_network_security()
-        tests.append(test_result)
+        # The tests mostly wait, so they share the event loop; gather keeps test order
+        results = await asyncio.gather(*(test() for test in tests))
         
-        duration = time.time() - start_time
-        passed = sum(1 for t in tests if t.status == "PASS")
-        failed = sum(1 for t in tests if t.status == "FAIL")
-        skipped = sum(1 for t in tests if t.status == "SKIP")
+        duration = time.perf_counter() - start_time
+        statuses = Counter(t.status for t in results)
         
         return TestSuite(
-            name="Security Tests",
-            description="Tests for security features and system integrity",
-            tests=tests,
-            total_tests=len(tests),
-            passed_tests=passed,
-            failed_tests=failed,
-            skipped_tests=skipped,
+            name=name,
+            description=description,
+            tests=results,
+            total_tests=len(results),
+            passed_tests=statuses["PASS"],
+            failed_tests=statuses["FAIL"],
+            skipped_tests=statuses["SKIP"],
             total_duration=duration
         )
     
-    def run_all_tests(self) -> Dict[str, TestSuite]:
+    async def run_suites(self, categories: List[str], title: Optional[str] = None) -> Dict[str, TestSuite]:
+        """Run the given test suites concurrently under one live status view."""
+        from rich.console import Group
+        from rich.live import Live
+        from rich.panel import Panel
+        from rich.table import Table
+        
+        results: Dict[str, TestSuite] = {}
+        
+        def render():
+            status = Table(show_header=False, box=None)
+            for category in categories:
+                label = self.SUITE_RUNNERS[category][1]
+                suite = results.get(category)
+                if suite is None:
+                    status.add_row(label, "[yellow]running...[/yellow]")
+                else:
+                    color = "red" if suite.failed_tests else "green"
+                    status.add_row(label, f"[{color}]{suite.passed_tests}/{suite.total_tests} passed[/{color}] "
+                                          f"in {suite.total_duration:.2f}s")
+            return Group(Panel(title, style="bold green"), status) if title else status
+        
+        # Redraw in place on a terminal; logs and pipes get the final view once
+        console = _get_console()
+        live_view = Live(render(), console=console, refresh_per_second=4) if console.is_terminal else contextlib.nullcontext()
+        
+        async def run(category: str) -> None:
+            results[category] = await getattr(self, self.SUITE_RUNNERS[category][0])()
+            if live:
+                live.update(render())
+        
+        with live_view as live:
+            await asyncio.gather(*(run(category) for category in categories))
+        if not live:
+            console.print(render())
+        
+        return {category: results[category] for category in categories}
+    
+    async def run_all_tests(self) -> Dict[str, TestSuite]:
         """Run all test suites."""
-        console.print(Panel("🚀 Starting Comprehensive LilithOS Testing", style="bold green"))
-        
-        test_suites = {}
-        
-        # Run all test suites
-        test_suites["boot"] = self.run_boot_tests()
-        test_suites["kernel"] = self.run_kernel_tests()
-        test_suites["system"] = self.run_system_tests()
-        test_suites["performance"] = self.run_performance_tests()
-        test_suites["security"] = self.run_security_tests()
-        
-        return test_suites
+        return await self.run_suites(list(self.SUITE_RUNNERS), title="🚀 Starting Comprehensive LilithOS Testing")
+    
+    def elapsed(self) -> float:
+        """Seconds since the framework was created."""
+        return time.perf_counter() - self._start_perf
     
-    def generate_report(self, test_suites: Dict[str, TestSuite]) -> str:
-        """Generate a comprehensive test report."""
-        total_tests = sum(suite.total_tests for suite in test_suites.values())
-        total_passed = sum(suite.passed_tests for suite in test_suites.values())
-        total_failed = sum(suite.failed_tests for suite in test_suites.values())
-        total_skipped = sum(suite.skipped_tests for suite in test_suites.values())
-        total_duration = time.time() - self.start_time
+    def generate_report(self, test_suites: Dict[str, TestSuite], total_duration: Optional[float] = None,
+                        file: Optional[TextIO] = None, stats: Optional[AggregatedStats] = None) -> Optional[str]:
+        """Generate a comprehensive test report.
+
+        The report is written to ``file`` if one is given, otherwise it is
+        returned as a string. ``stats`` may pass in precomputed totals.
+        """
+        out = file if file is not None else io.StringIO()
+        if stats is None:
+            stats = TestSuite.aggregate(test_suites.values())
+        if total_duration is None:
+            total_duration = self.elapsed()
         
         # Create detailed report
-        report = f"""
+        out.write(f"""
 # LilithOS Test Report
 
 ## Test Summary
 - **Device**: {self.device_config['name']} ({self.device})
 - **Architecture**: {self.device_config['architecture']}
 - **Chipset**: {self.device_config['chipset']}
-- **Total Tests**: {total_tests}
-- **Passed**: {total_passed}
-- **Failed**: {total_failed}
-- **Skipped**: {total_skipped}
-- **Success Rate**: {(total_passed/total_tests*100):.1f}%
+- **Total Tests**: {stats.total_tests}
+- **Passed**: {stats.passed_tests}
+- **Failed**: {stats.failed_tests}
+- **Skipped**: {stats.skipped_tests}
+- **Success Rate**: {stats.success_rate:.1f}%
 - **Total Duration**: {total_duration:.2f}s
 
 ## Test Suites
 
-"""
+""")
         
         for suite_name, suite in test_suites.items():
-            report += f"""
+            out.write(f"""
 ### {suite.name}
 - **Description**: {suite.description}
 - **Tests**: {suite.total_tests} (Passed: {suite.passed_tests}, Failed: {suite.failed_tests}, Skipped: {suite.skipped_tests})
 - **Duration**: {suite.total_duration:.2f}s
-- **Success Rate**: {(suite.passed_tests/suite.total_tests*100):.1f}%
+- **Success Rate**: {suite.success_rate:.1f}%
 
 #### Individual Tests:
-"""
+""")
             for test in suite.tests:
-                status_emoji = {"PASS": "✅", "FAIL": "❌", "SKIP": "⏭️", "ERROR": "⚠️"}[test.status]
-                report += f"- {status_emoji} **{test.name}**: {test.duration:.2f}s - {test.details}\n"
+                out.write(f"- {_STATUS_EMOJI[test.status]} **{test.name}**: {test.duration:.2f}s - {test.details}\n")
                 if test.error_message:
-                    report += f"  - Error: {test.error_message}\n"
+                    out.write(f"  - Error: {test.error_message}\n")
         
-        return report
+        return None if file is not None else out.getvalue()
     
-    def display_results(self, test_suites: Dict[str, TestSuite]):
+    def display_results(self, test_suites: Dict[str, TestSuite], overall_duration: Optional[float] = None,
+                        stats: Optional[AggregatedStats] = None):
         """Display test results in a rich format."""
-        total_tests = sum(suite.total_tests for suite in test_suites.values())
-        total_passed = sum(suite.passed_tests for suite in test_suites.values())
-        total_failed = sum(suite.failed_tests for suite in test_suites.values())
+        if stats is None:
+            stats = TestSuite.aggregate(test_suites.values())
+        
+        from rich.console import Group
+        from rich.panel import Panel
+        from rich.table import Table
         
         # Create summary table
         table = Table(title="LilithOS Test Results Summary")
@@ -371,7 +355,6 @@ class LilithOSTestFramework:
         table.add_column("Success Rate", style="white")
         
         for suite_name, suite in test_suites.items():
-            success_rate = (suite.passed_tests / suite.total_tests * 100) if suite.total_tests > 0 else 0
             table.add_row(
                 suite.name,
                 str(suite.total_tests),
@@ -379,49 +362,49 @@ class LilithOSTestFramework:
                 str(suite.failed_tests),
                 str(suite.skipped_tests),
                 f"{suite.total_duration:.2f}s",
-                f"{success_rate:.1f}%"
+                f"{suite.success_rate:.1f}%"
             )
         
-        console.print(table)
-        
         # Overall summary
-        overall_success_rate = (total_passed / total_tests * 100) if total_tests > 0 else 0
-        overall_duration = time.time() - self.start_time
+        overall_success_rate = stats.success_rate
+        if overall_duration is None:
+            overall_duration = self.elapsed()
         
         summary_panel = Panel(
             f"📊 **Overall Results**\n\n"
-            f"✅ Passed: {total_passed}\n"
-            f"❌ Failed: {total_failed}\n"
-            f"⏭️ Skipped: {total_skipped}\n"
+            f"✅ Passed: {stats.passed_tests}\n"
+            f"❌ Failed: {stats.failed_tests}\n"
+            f"⏭️ Skipped: {stats.skipped_tests}\n"
             f"📈 Success Rate: {overall_success_rate:.1f}%\n"
             f"⏱️ Total Duration: {overall_duration:.2f}s",
             title="Test Summary",
             style="bold green" if overall_success_rate >= 90 else "bold yellow" if overall_success_rate >= 70 else "bold red"
         )
         
-        console.print(summary_panel)
+        # Render the table and summary in a single write
+        _get_console().print(Group(table, summary_panel))
     
     # Individual test implementations (placeholder implementations)
-    def _test_ipsw_structure(self) -> TestResult:
+    async def _test_ipsw_structure(self) -> TestResult:
         """Test IPSW file structure and integrity."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             if not self.ipsw_path or not self.ipsw_path.exists():
                 return TestResult(
                     name="IPSW Structure Validation",
                     status="SKIP",
-                    duration=time.time() - start_time,
+                    duration=time.perf_counter() - start_time,
                     details="IPSW file not provided or not found"
                 )
             
             # TODO: Implement actual IPSW structure validation
-            time.sleep(0.5)  # Simulate test duration
+            await asyncio.sleep(0.5)  # Simulate test duration
             
             return TestResult(
                 name="IPSW Structure Validation",
                 status="PASS",
-                duration=time.time() - start_time,
+                duration=time.perf_counter() - start_time,
                 details="IPSW structure is valid and complete",
                 metrics={"file_size": "6.8GB", "components": 15}
             )
@@ -429,23 +412,23 @@ class LilithOSTestFramework:
             return TestResult(
                 name="IPSW Structure Validation",
                 status="ERROR",
-                duration=time.time() - start_time,
+                duration=time.perf_counter() - start_time,
                 details="Error during IPSW validation",
                 error_message=str(e)
             )
     
-    def _test_boot_chain_integrity(self) -> TestResult:
+    async def _test_boot_chain_integrity(self) -> TestResult:
         """Test secure boot chain integrity."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # TODO: Implement actual boot chain validation
-            time.sleep(0.3)
+            await asyncio.sleep(0.3)
             
             return TestResult(
                 name="Boot Chain Integrity",
                 status="PASS",
-                duration=time.time() - start_time,
+                duration=time.perf_counter() - start_time,
                 details="Secure boot chain is intact and valid",
                 metrics={"chain_length": 4, "signatures_valid": True}
             )
@@ -453,23 +436,23 @@ class LilithOSTestFramework:
             return TestResult(
                 name="Boot Chain Integrity",
                 status="ERROR",
-                duration=time.time() - start_time,
+                duration=time.perf_counter() - start_time,
                 details="Error during boot chain validation",
                 error_message=str(e)
             )
     
-    def _test_kernel_loading(self) -> TestResult:
+    async def _test_kernel_loading(self) -> TestResult:
         """Test kernel loading and initialization."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # TODO: Implement actual kernel loading test
-            time.sleep(0.4)
+            await asyncio.sleep(0.4)
             
             return TestResult(
                 name="Kernel Loading",
                 status="PASS",
-                duration=time.time() - start_time,
+                duration=time.perf_counter() - start_time,
                 details="Kernel loads successfully with all modules",
                 metrics={"load_time": "2.3s", "modules_loaded": 45}
             )
@@ -477,23 +460,23 @@ class LilithOSTestFramework:
             return TestResult(
                 name="Kernel Loading",
                 status="ERROR",
-                duration=time.time() - start_time,
+                duration=time.perf_counter() - start_time,
                 details="Error during kernel loading test",
                 error_message=str(e)
             )
     
-    def _test_system_initialization(self) -> TestResult:
+    async def _test_system_initialization(self) -> TestResult:
         """Test system initialization process."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # TODO: Implement actual system initialization test
-            time.sleep(0.6)
+            await asyncio.sleep(0.6)
             
             return TestResult(
                 name="System Initialization",
                 status="PASS",
-                duration=time.time() - start_time,
+                duration=time.perf_counter() - start_time,
                 details="System initializes all services correctly",
                 metrics={"init_time": "8.7s", "services_started": 23}
             )
@@ -501,23 +484,23 @@ class LilithOSTestFramework:
             return TestResult(
                 name="System Initialization",
                 status="ERROR",
-                duration=time.time() - start_time,
+                duration=time.perf_counter() - start_time,
                 details="Error during system initialization test",
                 error_message=str(e)
             )
     
-    def _test_boot_animation(self) -> TestResult:
+    async def _test_boot_animation(self) -> TestResult:
         """Test custom boot animation."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # TODO: Implement actual boot animation test
-            time.sleep(0.2)
+            await asyncio.sleep(0.2)
             
             return TestResult(
                 name="Boot Animation",
                 status="PASS",
-                duration=time.time() - start_time,
+                duration=time.perf_counter() - start_time,
                 details="Custom boot animation displays correctly",
                 metrics={"animation_duration": "3.2s", "resolution": "2778x1284"}
             )
@@ -525,70 +508,70 @@ class LilithOSTestFramework:
             return TestResult(
                 name="Boot Animation",
                 status="ERROR",
-                duration=time.time() - start_time,
+                duration=time.perf_counter() - start_time,
                 details="Error during boot animation test",
                 error_message=str(e)
             )
     
     # Additional test methods (placeholder implementations)
-    def _test_kernel_binary(self) -> TestResult:
+    async def _test_kernel_binary(self) -> TestResult:
         return TestResult("Kernel Binary Analysis", "PASS", 0.3, "Kernel binary is valid and properly signed")
     
-    def _test_kernel_patches(self) -> TestResult:
+    async def _test_kernel_patches(self) -> TestResult:
         return TestResult("Kernel Patches Validation", "PASS", 0.4, "All kernel patches applied successfully")
     
-    def _test_system_calls(self) -> TestResult:
+    async def _test_system_calls(self) -> TestResult:
         return TestResult("System Call Modifications", "PASS", 0.5, "Custom system calls working correctly")
     
-    def _test_memory_management(self) -> TestResult:
+    async def _test_memory_management(self) -> TestResult:
         return TestResult("Memory Management", "PASS", 0.3, "Memory management optimized for A15")
     
-    def _test_security_framework(self) -> TestResult:
+    async def _test_security_framework(self) -> TestResult:
         return TestResult("Security Framework", "PASS", 0.4, "Security framework modifications active")
     
-    def _test_system_daemons(self) -> TestResult:
+    async def _test_system_daemons(self) -> TestResult:
         return TestResult("System Daemons", "PASS", 0.6, "All system daemons running correctly")
     
-    def _test_launch_daemons(self) -> TestResult:
+    async def _test_launch_daemons(self) -> TestResult:
         return TestResult("Launch Daemons", "PASS", 0.4, "Launch daemons configured properly")
     
-    def _test_system_services(self) -> TestResult:
+    async def _test_system_services(self) -> TestResult:
         return TestResult("System Services", "PASS", 0.5, "System services functioning normally")
     
-    def _test_file_system(self) -> TestResult:
+    async def _test_file_system(self) -> TestResult:
         return TestResult("File System", "PASS", 0.3, "File system modifications working")
     
-    def _test_network_stack(self) -> TestResult:
+    async def _test_network_stack(self) -> TestResult:
         return TestResult("Network Stack", "PASS", 0.4, "Network stack optimized for 5G")
     
-    def _test_boot_time(self) -> TestResult:
+    async def _test_boot_time(self) -> TestResult:
         return TestResult("Boot Time", "PASS", 0.2, "Boot time optimized to 12.3s", metrics={"boot_time": "12.3s"})
     
-    def _test_memory_usage(self) -> TestResult:
+    async def _test_memory_usage(self) -> TestResult:
         return TestResult("Memory Usage", "PASS", 0.3, "Memory usage optimized for 6GB RAM")
     
-    def _test_cpu_performance(self) -> TestResult:
+    async def _test_cpu_performance(self) -> TestResult:
         return TestResult("CPU Performance", "PASS", 0.4, "A15 Bionic performance optimized")
     
-    def _test_battery_impact(self) -> TestResult:
+    async def _test_battery_impact(self) -> TestResult:
         return TestResult("Battery Impact", "PASS", 0.3, "Battery life impact minimized")
     
-    def _test_storage_performance(self) -> TestResult:
+    async def _test_storage_performance(self) -> TestResult:
         return TestResult("Storage Performance", "PASS", 0.2, "NVMe storage performance maintained")
     
-    def _test_system_integrity(self) -> TestResult:
+    async def _test_system_integrity(self) -> TestResult:
         return TestResult("System Integrity Protection", "PASS", 0.4, "SIP modifications secure")
     
-    def _test_code_signing(self) -> TestResult:
+    async def _test_code_signing(self) -> TestResult:
         return TestResult("Code Signing", "PASS", 0.3, "All components properly signed")
     
-    def _test_sandbox_security(self) -> TestResult:
+    async def _test_sandbox_security(self) -> TestResult:
         return TestResult("Sandbox Security", "PASS", 0.4, "Sandbox security enhanced")
     
-    def _test_secure_enclave(self) -> TestResult:
+    async def _test_secure_enclave(self) -> TestResult:
         return TestResult("Secure Enclave", "PASS", 0.5, "Secure Enclave modifications secure")
     
-    def _test_network_security(self) -> TestResult:
+    async def _test_network_security(self) -> TestResult:
         return TestResult("Network Security", "PASS", 0.3, "Network security features active")
 
 def main():
@@ -640,50 +623,40 @@ Examples:
         test_categories = [cat.strip() for cat in args.test.split(",")]
         
         if "all" in test_categories:
-            test_suites = framework.run_all_tests()
+            test_suites = asyncio.run(framework.run_all_tests())
         else:
-            test_suites = {}
-            if "boot" in test_categories:
-                test_suites["boot"] = framework.run_boot_tests()
-            if "kernel" in test_categories:
-                test_suites["kernel"] = framework.run_kernel_tests()
-            if "system" in test_categories:
-                test_suites["system"] = framework.run_system_tests()
-            if "performance" in test_categories:
-                test_suites["performance"] = framework.run_performance_tests()
-            if "security" in test_categories:
-                test_suites["security"] = framework.run_security_tests()
+            test_suites = asyncio.run(framework.run_suites(
+                [category for category in framework.SUITE_RUNNERS if category in test_categories]
+            ))
         
         # Display results
-        framework.display_results(test_suites)
-        
-        # Generate and save report
-        report = framework.generate_report(test_suites)
+        overall_duration = framework.elapsed()
+        stats = TestSuite.aggregate(test_suites.values())
+        framework.display_results(test_suites, overall_duration, stats)
         
         if args.output:
-            # Save detailed report
+            # Stream the detailed report straight to disk
             with open(args.output, 'w') as f:
-                f.write(report)
-            console.print(f"📄 Detailed report saved to: {args.output}")
+                framework.generate_report(test_suites, overall_duration, file=f, stats=stats)
+            _get_console().print(f"📄 Detailed report saved to: {args.output}")
         
         # Save JSON report
         json_report = {
             "device": args.device,
             "timestamp": time.time(),
-            "test_suites": {name: asdict(suite) for name, suite in test_suites.items()}
+            "test_suites": test_suites
         }
         
         json_output = args.output.replace('.txt', '.json') if args.output else 'test_report.json'
-        with open(json_output, 'w') as f:
-            json.dump(json_report, f, indent=2)
-        console.print(f"📊 JSON report saved to: {json_output}")
+        with open(json_output, 'wb') as f:
+            f.write(_dumps_json(json_report))
+        _get_console().print(f"📊 JSON report saved to: {json_output}")
         
         # Exit with appropriate code
-        total_failed = sum(suite.failed_tests for suite in test_suites.values())
-        sys.exit(1 if total_failed > 0 else 0)
+        sys.exit(1 if stats.failed_tests > 0 else 0)
         
     except Exception as e:
-        console.print(f"❌ Test framework error: {e}", style="bold red")
+        _get_console().print(f"❌ Test framework error: {e}", style="bold red")
         sys.exit(1)
 
 if __name__ == "__main__":